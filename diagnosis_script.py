@@ -6,18 +6,101 @@ Checks system prerequisites and identifies configuration issues.
 Run this before executing the main application to catch problems early.
 """
 
+import asyncio
+import http.client
+import importlib.metadata
+import io
+import os
+import re
+import shutil
+import socket
 import subprocess
 import sys
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+import urllib.parse
 import urllib.request
 import urllib.error
 
+try:
+    import yaml
+    # libyaml's C loader is several times faster than the pure-Python one
+    _YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+except ImportError:
+    yaml = None
+
+DOCKER_SOCKET = "/var/run/docker.sock"
+OLLAMA_BASE_URL = "http://localhost:11434"
+REQUIRED_MODELS = frozenset([
+    "llama3.1:8b-instruct-q4_K_M",
+    "mistral:7b-instruct",
+    "qwen2.5:7b-instruct-q4_K_M",
+    "gemma2:9b-instruct-q4_K_M",
+    "phi3.5:3.8b-mini-instruct-q4_K_M"
+])
+COMPOSE_SERVICES = ("ollama", "neo4j")
+
+# One `docker compose ps` row: container name first, then the first status
+# keyword on the line (v1 prints "Up", v2 prints "Up 2 hours" etc.)
+_COMPOSE_LINE = re.compile(
+    r'^(?P<name>\S+)[ \t].*?\b(?P<state>Up|Exited|Created|Restarting|Paused|Dead)\b',
+    re.MULTILINE
+)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection that talks to the Docker Engine API over its UNIX socket."""
+
+    def __init__(self, socket_path, timeout=2):
+        super().__init__("localhost", timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class _ThreadBufferedStdout:
+    """
+    sys.stdout proxy that lets worker threads print into private buffers.
+
+    Threads that have not installed a buffer write straight through to the
+    wrapped stream.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def start_buffer(self):
+        self._local.buffer = io.StringIO()
+
+    def pop_buffer(self):
+        buffer = self._local.buffer
+        self._local.buffer = None
+        return buffer.getvalue()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is not None:
+            return buffer.write(text)
+        return self._stream.write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
 def print_header(text):
     """Print a section header."""
-    print(f"\n{'=' * 60}")
-    print(f"  {text}")
-    print('=' * 60)
+    rule = '=' * 60
+    sys.stdout.write(f"\n{rule}\n  {text}\n{rule}\n")
 
 def print_status(label, status, message=""):
     """Print a status line with color."""
@@ -25,114 +108,282 @@ def print_status(label, status, message=""):
         status_text = "✓ OK"
     elif status == "WARNING":
         status_text = "⚠ WARNING"
+    elif status == "SKIPPED":
+        status_text = "⊘ SKIPPED"
     else:
         status_text = "✗ FAIL"
     
-    print(f"{label:.<40} {status_text}")
+    line = f"{label:.<40} {status_text}\n"
     if message:
-        print(f"  → {message}")
+        line += f"  → {message}\n"
+    sys.stdout.write(line)
+
+@lru_cache(maxsize=1)
+def _docker_running():
+    """
+    Probe the Docker daemon once per process.
+
+    Connecting to the daemon socket takes microseconds, while the docker CLI
+    needs about a second to start. The CLI is only used when the socket is
+    missing (Windows, or a TCP-only daemon).
+
+    Returns:
+        (running, error message or None)
+    """
+    if os.path.exists(DOCKER_SOCKET):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(0.2)
+        try:
+            sock.connect(DOCKER_SOCKET)
+            return True, None
+        except OSError as e:
+            return False, f"Docker socket not accepting connections ({e})"
+        finally:
+            sock.close()
 
-def check_docker():
-    """Check if Docker is running."""
-    print_header("Docker Service Check")
-    
     try:
         result = subprocess.run(
-            ["docker", "ps"],
-            capture_output=True,
-            text=True,
-            timeout=5
+            ["docker", "version", "--format", "{{.Server.Version}}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=2
         )
-        
-        if result.returncode == 0:
-            print_status("Docker service", "OK")
-            return True
-        else:
-            print_status("Docker service", "FAIL", "Docker is not running")
-            return False
-            
     except FileNotFoundError:
-        print_status("Docker installation", "FAIL", "Docker not found in PATH")
-        return False
+        return False, "Docker not found in PATH"
     except subprocess.TimeoutExpired:
-        print_status("Docker service", "FAIL", "Docker command timeout")
-        return False
+        return False, "Docker command timeout"
+
+    if result.returncode == 0:
+        return True, None
+    return False, "Docker is not running"
+
+
+def _container_states_from_api():
+    """
+    List the compose containers through the Docker Engine HTTP API.
+
+    Returns:
+        Dict mapping service name to container state (e.g. "running")
+    """
+    filters = urllib.parse.quote(json.dumps({"name": list(COMPOSE_SERVICES)}))
+    conn = _UnixHTTPConnection(DOCKER_SOCKET)
+    try:
+        conn.request("GET", f"/v1.41/containers/json?all=1&filters={filters}")
+        response = conn.getresponse()
+        body = response.read()
+        if response.status != 200:
+            raise RuntimeError(f"Docker API returned status {response.status}")
+    finally:
+        conn.close()
+
+    states = {}
+    for container in json.loads(body):
+        names = " ".join(container.get("Names", []))
+        for service in COMPOSE_SERVICES:
+            if service in names:
+                states[service] = container.get("State", "")
+    return states
+
+
+@lru_cache(maxsize=1)
+def _compose_command():
+    """
+    Pick the Compose CLI once per process.
+    
+    Prefers the Go-based `docker compose` v2 plugin, which starts much faster
+    than the legacy Python `docker-compose` v1 binary (and v1 is EOL).
+    
+    Returns:
+        Command prefix as a tuple of arguments
+    """
+    if shutil.which("docker"):
+        try:
+            result = subprocess.run(
+                ["docker", "compose", "version"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=2
+            )
+            if result.returncode == 0:
+                return ("docker", "compose")
+        except subprocess.TimeoutExpired:
+            pass
+    return ("docker-compose",)
+
+
+def _container_states_from_compose():
+    """
+    List the compose containers by parsing `docker compose ps` output.
+
+    Each service is matched against its own output row, so one running
+    container no longer marks every other container as up.
+
+    Returns:
+        Dict mapping service name to container state (e.g. "running")
+    """
+    result = subprocess.run(
+        [*_compose_command(), "ps"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=5
+    )
+    stdout = result.stdout.decode("utf-8", "replace")
+
+    states = {}
+    for match in _COMPOSE_LINE.finditer(stdout):
+        state = match["state"]
+        for service in COMPOSE_SERVICES:
+            if service in match["name"]:
+                states[service] = "running" if state == "Up" else state.lower()
+    return states
+
+
+@lru_cache(maxsize=1)
+def _container_states():
+    """Look up compose container states once per process."""
+    if os.path.exists(DOCKER_SOCKET):
+        return _container_states_from_api()
+    return _container_states_from_compose()
+
+
+def check_docker():
+    """Check if Docker is running."""
+    print_header("Docker Service Check")
+    
+    try:
+        running, error = _docker_running()
     except Exception as e:
         print_status("Docker service", "FAIL", str(e))
         return False
+    
+    if running:
+        print_status("Docker service", "OK")
+        return True
+    
+    label = "Docker installation" if error == "Docker not found in PATH" else "Docker service"
+    print_status(label, "FAIL", error)
+    return False
 
 def check_docker_compose():
     """Check if docker-compose services are running."""
     print_header("Docker Compose Services")
     
     try:
-        result = subprocess.run(
-            ["docker-compose", "ps"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
+        states = _container_states()
         
-        if "ollama" in result.stdout:
-            if "Up" in result.stdout:
-                print_status("Ollama container", "OK")
-            else:
-                print_status("Ollama container", "WARNING", "Container exists but may not be running")
+        ollama_state = states.get("ollama")
+        if ollama_state == "running":
+            print_status("Ollama container", "OK")
+        elif ollama_state:
+            print_status("Ollama container", "WARNING", f"Container exists but is {ollama_state}")
         else:
             print_status("Ollama container", "FAIL", "Not found - run 'docker-compose up -d'")
         
-        if "neo4j" in result.stdout:
-            if "Up" in result.stdout:
-                print_status("Neo4j container", "OK")
-            else:
-                print_status("Neo4j container", "WARNING", "Container exists but may not be running")
+        neo4j_state = states.get("neo4j")
+        if neo4j_state == "running":
+            print_status("Neo4j container", "OK")
+        elif neo4j_state:
+            print_status("Neo4j container", "WARNING", f"Container exists but is {neo4j_state}")
         else:
             print_status("Neo4j container", "WARNING", "Not found (optional for v0.1.0)")
+        
+        return ollama_state == "running"
             
     except Exception as e:
         print_status("Docker Compose", "FAIL", str(e))
+        return False
+
+async def _probe_ollama_async(base_url):
+    """Fetch /api/tags, /api/ps and /api/version concurrently with httpx."""
+    import httpx
+    
+    try:
+        async with httpx.AsyncClient(base_url=base_url, timeout=5.0) as client:
+            tags, ps, version = await asyncio.gather(
+                client.get("/api/tags"),
+                client.get("/api/ps"),
+                client.get("/api/version"),
+                return_exceptions=True
+            )
+    except httpx.TransportError as e:
+        raise ConnectionError(str(e)) from e
+    
+    if isinstance(tags, httpx.TransportError):
+        raise ConnectionError(str(tags)) from tags
+    if isinstance(tags, Exception):
+        raise tags
+    tags.raise_for_status()
+    
+    def optional_json(response):
+        if isinstance(response, Exception) or response.status_code != 200:
+            return None
+        return response.json()
+    
+    return {
+        "tags": tags.json(),
+        "ps": optional_json(ps),
+        "version": optional_json(version)
+    }
+
+
+def _probe_ollama(base_url):
+    """
+    Probe the Ollama API.
+    
+    Uses concurrent httpx requests when httpx is installed, otherwise falls
+    back to a single urllib request for /api/tags.
+    
+    Returns:
+        Dict with "tags", "ps" and "version" response bodies (None if unavailable)
+    """
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        req = urllib.request.Request(f"{base_url}/api/tags", method='GET')
+        with urllib.request.urlopen(req, timeout=5) as response:
+            return {"tags": json.loads(response.read()), "ps": None, "version": None}
+    
+    return asyncio.run(_probe_ollama_async(base_url))
+
 
 def check_ollama():
     """Check if Ollama is accessible."""
     print_header("Ollama Service Check")
     
-    ollama_url = "http://localhost:11434/api/tags"
+    ollama_url = f"{OLLAMA_BASE_URL}/api/tags"
     
     try:
-        req = urllib.request.Request(ollama_url, method='GET')
-        with urllib.request.urlopen(req, timeout=5) as response:
-            data = json.loads(response.read())
+        probe = _probe_ollama(OLLAMA_BASE_URL)
+        data = probe["tags"]
+        
+        print_status("Ollama API", "OK", f"Connected to {ollama_url}")
+        
+        if probe["version"]:
+            print(f"  Ollama version: {probe['version'].get('version', 'unknown')}")
+        
+        if probe["ps"] is not None:
+            print(f"  Models loaded in memory: {len(probe['ps'].get('models', []))}")
+        
+        if 'models' in data:
+            models = data['models']
+            print(f"\n  Downloaded models: {len(models)}")
             
-            print_status("Ollama API", "OK", f"Connected to {ollama_url}")
+            # Check for required models
+            model_names = {m['name'] for m in models}
             
-            if 'models' in data:
-                models = data['models']
-                print(f"\n  Downloaded models: {len(models)}")
-                
-                # Check for required models
-                required_models = [
-                    "llama3.1:8b-instruct-q4_K_M",
-                    "mistral:7b-instruct",
-                    "qwen2.5:7b-instruct-q4_K_M",
-                    "gemma2:9b-instruct-q4_K_M",
-                    "phi3.5:3.8b-mini-instruct-q4_K_M"
-                ]
-                
-                model_names = [m['name'] for m in models]
-                
-                for req_model in required_models:
-                    if req_model in model_names:
-                        print(f"    ✓ {req_model}")
-                    else:
-                        print(f"    ✗ {req_model} - MISSING")
-                
-                return True
-            else:
-                print_status("Ollama models", "WARNING", "No models found")
-                return False
+            for req_model in sorted(REQUIRED_MODELS & model_names):
+                print(f"    ✓ {req_model}")
+            for req_model in sorted(REQUIRED_MODELS - model_names):
+                print(f"    ✗ {req_model} - MISSING")
+            
+            return True
+        else:
+            print_status("Ollama models", "WARNING", "No models found")
+            return False
                 
-    except urllib.error.URLError as e:
-        print_status("Ollama API", "FAIL", f"Cannot connect - {e.reason}")
+    except (urllib.error.URLError, ConnectionError) as e:
+        reason = getattr(e, "reason", e)
+        print_status("Ollama API", "FAIL", f"Cannot connect - {reason}")
         print("  → Make sure Ollama is running: docker-compose up -d")
         return False
     except Exception as e:
@@ -145,14 +396,20 @@ def check_vram_config():
     
     config_file = Path("config/agents.yaml")
     
-    if not config_file.exists():
+    try:
+        f = open(config_file, 'r')
+    except FileNotFoundError:
         print_status("agents.yaml", "FAIL", "Configuration file not found")
         return False
     
+    if yaml is None:
+        f.close()
+        print_status("PyYAML", "WARNING", "Install with: pip install pyyaml")
+        return True
+    
     try:
-        import yaml
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        with f:
+            config = yaml.load(f, Loader=_YamlLoader)
         
         agents = config.get('agents', {})
         max_vram = 6000  # RTX 3050 limit
@@ -183,9 +440,6 @@ def check_vram_config():
             print("\n  ✓ All agents fit within 6GB VRAM limit")
             return True
             
-    except ImportError:
-        print_status("PyYAML", "WARNING", "Install with: pip install pyyaml")
-        return True
     except Exception as e:
         print_status("Config validation", "FAIL", str(e))
         return False
@@ -194,27 +448,24 @@ def check_python_deps():
     """Check if required Python packages are installed."""
     print_header("Python Dependencies")
     
+    # (import name, distribution name) - only the installed-package metadata
+    # is read, so none of these modules are actually imported
     required = [
-        "pydantic",
-        "yaml",
-        "httpx",
-        "rich",
-        "jinja2",
-        "dotenv"
+        ("pydantic", "pydantic"),
+        ("yaml", "PyYAML"),
+        ("httpx", "httpx"),
+        ("rich", "rich"),
+        ("jinja2", "Jinja2"),
+        ("dotenv", "python-dotenv")
     ]
     
     all_ok = True
     
-    for package in required:
+    for package, dist_name in required:
         try:
-            if package == "yaml":
-                __import__("yaml")
-            elif package == "dotenv":
-                __import__("dotenv")
-            else:
-                __import__(package)
+            importlib.metadata.distribution(dist_name)
             print_status(package, "OK")
-        except ImportError:
+        except importlib.metadata.PackageNotFoundError:
             print_status(package, "FAIL", "Not installed")
             all_ok = False
     
@@ -231,22 +482,55 @@ def main():
 ╚══════════════════════════════════════════════════════════╝
     """)
     
+    # (name, check, names of checks that must pass first)
     checks = [
-        ("Python Dependencies", check_python_deps),
-        ("Docker", check_docker),
-        ("Docker Compose", check_docker_compose),
-        ("Ollama", check_ollama),
-        ("VRAM Config", check_vram_config)
+        ("Python Dependencies", check_python_deps, ()),
+        ("Docker", check_docker, ()),
+        ("Docker Compose", check_docker_compose, ("Docker",)),
+        # Ollama is probed over HTTP at OLLAMA_BASE_URL and may be a native
+        # or remote install, so it does not depend on the Docker check
+        ("Ollama", check_ollama, ()),
+        ("VRAM Config", check_vram_config, ())
     ]
     
-    results = {}
+    # The checks are independent and mostly wait on subprocesses, sockets
+    # and files, so run them concurrently. Each check prints into its own
+    # buffer and the buffers are replayed in order to keep the report readable.
+    # Checks whose prerequisites failed are skipped rather than left to time out.
+    stdout = _ThreadBufferedStdout(sys.stdout)
+    futures = {}
     
-    for name, check_func in checks:
+    def run_check(name, check_func, depends_on):
+        failed = [dep for dep in depends_on if not futures[dep].result()[0]]
+        stdout.start_buffer()
+        if failed:
+            print_header(name)
+            print_status(name, "SKIPPED", f"depends on {', '.join(failed)}")
+            return None, stdout.pop_buffer()
         try:
-            results[name] = check_func()
+            result = check_func()
         except Exception as e:
             print(f"\n✗ {name} check failed: {e}")
-            results[name] = False
+            result = False
+        return result, stdout.pop_buffer()
+    
+    results = {}
+    outputs = {}
+    
+    sys.stdout = stdout
+    try:
+        # Prerequisites come first in `checks`, so their futures exist
+        # before any dependent check looks them up
+        with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+            for name, check_func, depends_on in checks:
+                futures[name] = executor.submit(run_check, name, check_func, depends_on)
+            for name, future in futures.items():
+                results[name], outputs[name] = future.result()
+    finally:
+        sys.stdout = stdout._stream
+    
+    sys.stdout.write("".join(outputs[name] for name, _, _ in checks))
+    sys.stdout.flush()
     
     # Summary
     print_header("Summary")
@@ -256,6 +540,10 @@ def main():
     
     print(f"\nPassed: {passed}/{total}")
     
+    skipped = [name for name, result in results.items() if result is None]
+    if skipped:
+        print(f"Skipped: {', '.join(skipped)}")
+    
     if all(results.values()):
         print("\n✓ All checks passed! Ready to run ZenKnowledgeForge.")
         return 0
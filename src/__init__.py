@@ -2,31 +2,38 @@
 ZenKnowledgeForge - Local-first deliberative multi-agent LLM system
 
 This module provides the main package interface for ZenKnowledgeForge.
-"""
-
-__version__ = "0.1.0"
 
-# Core orchestration
-from .orchestration.config import ConfigLoader
-from .orchestration.model_manager import ModelManager
-from .orchestration.engine import PipelineEngine
-from .orchestration.state import SharedState, ExecutionMode
+Public names are imported lazily on first access (PEP 562), so importing
+the package does not pull in pydantic, httpx, rich or Jinja2 until a
+component that needs them is used.
+"""
 
-# Agents
-from .agents.interpreter import InterpreterAgent
-from .agents.planner import PlannerAgent
-from .agents.grounder import GrounderAgent
-from .agents.auditor import AuditorAgent
-from .agents.visualizer import VisualizerAgent
-from .agents.judge import JudgeAgent
+import importlib
 
-# CLI
-from .cli.parser import create_parser
-from .cli.progress import ProgressUI
-from .cli.interactive import InteractiveMode
+__version__ = "0.1.0"
 
-# Renderers
-from .renderers.markdown import MarkdownRenderer
+# Public name -> (submodule, attribute)
+_LAZY_IMPORTS = {
+    # Core orchestration
+    "ConfigLoader": (".orchestration.config", "ConfigLoader"),
+    "ModelManager": (".orchestration.model_manager", "ModelManager"),
+    "PipelineEngine": (".orchestration.engine", "PipelineEngine"),
+    "SharedState": (".orchestration.state", "SharedState"),
+    "ExecutionMode": (".orchestration.state", "ExecutionMode"),
+    # Agents
+    "InterpreterAgent": (".agents.interpreter", "InterpreterAgent"),
+    "PlannerAgent": (".agents.planner", "PlannerAgent"),
+    "GrounderAgent": (".agents.grounder", "GrounderAgent"),
+    "AuditorAgent": (".agents.auditor", "AuditorAgent"),
+    "VisualizerAgent": (".agents.visualizer", "VisualizerAgent"),
+    "JudgeAgent": (".agents.judge", "JudgeAgent"),
+    # CLI
+    "create_parser": (".cli.parser", "create_parser"),
+    "ProgressUI": (".cli.progress", "ProgressUI"),
+    "InteractiveMode": (".cli.interactive", "InteractiveMode"),
+    # Renderers
+    "MarkdownRenderer": (".renderers.markdown", "MarkdownRenderer"),
+}
 
 __all__ = [
     "__version__",
@@ -50,3 +57,19 @@ __all__ = [
     # Renderers
     "MarkdownRenderer",
 ]
+
+
+def __getattr__(name):
+    """Import public names on first access and cache them on the module."""
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
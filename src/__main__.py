@@ -5,79 +5,302 @@ This module provides the CLI interface for running the deliberative multi-agent
 """
 
 import sys
+import asyncio
+import bisect
+import importlib
+import json
+import re
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
+from typing import Any, Dict, Optional, Tuple
 import logging
 
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON serialization
+    orjson = None
+
 from .cli.parser import create_parser, validate_args, get_log_level
 from .cli.progress import ProgressUI
-from .cli.interactive import InteractiveMode
 from .orchestration.config import ConfigLoader
-from .orchestration.model_manager import ModelManager
 from .orchestration.engine import PipelineEngine
 from .orchestration.state import ExecutionMode
 from .orchestration.logging_config import setup_logging
-from .agents.interpreter import InterpreterAgent
-from .agents.planner import PlannerAgent
-from .agents.grounder import GrounderAgent
-from .agents.auditor import AuditorAgent
-from .agents.visualizer import VisualizerAgent
-from .agents.judge import JudgeAgent
-from .renderers.markdown import MarkdownRenderer
 
 
 logger = logging.getLogger(__name__)
 
 
-def _run_preflight_checks(ui, config_loader) -> bool:
+# (agent name, class name in src/agents/<agent name>.py,
+#  ((agent-specific config field, default), ...))
+# Agent modules are imported on registration, so --help and --dry-run never
+# load them (the Grounder pulls in ChromaDB and sentence-transformers).
+_AGENT_SPECS = (
+    ("interpreter", "InterpreterAgent", (("max_questions", 5),)),
+    ("planner", "PlannerAgent", (("max_research_questions", 5),)),
+    ("grounder", "GrounderAgent", (("max_sources", 10),)),
+    ("auditor", "AuditorAgent", ()),
+    ("visualizer", "VisualizerAgent", ()),
+    ("judge", "JudgeAgent", (("consensus_threshold", 0.85), ("max_deliberation_rounds", 7))),
+)
+
+
+def _load_agent_class(agent_name: str, class_name: str) -> type:
+    """
+    Import an agent class on first use.
+    
+    Args:
+        agent_name: Agent name, which is also its module name
+        class_name: Agent class name
+    
+    Returns:
+        Agent class
+    """
+    module = importlib.import_module(f".agents.{agent_name}", __package__)
+    return getattr(module, class_name)
+
+
+# Parameter count in an Ollama model tag, e.g. "7b", "3.8b", or a
+# mixture-of-experts "8x7b" (experts x per-expert size)
+_MODEL_SIZE_RE = re.compile(r'(?:(\d+)x)?(\d+(?:\.\d+)?)b(?![a-z])', re.IGNORECASE)
+
+# Conservative VRAM estimates: models up to _VRAM_SIZE_LIMITS[i] billion
+# parameters get _VRAM_ESTIMATES_MB[i]; larger models get the last entry
+_VRAM_SIZE_LIMITS = (4.0, 7.0, 9.0, 14.0)
+_VRAM_ESTIMATES_MB = (3000, 4500, 5500, 9000, 12000)
+
+# Used when the model tag carries no parameter count
+_DEFAULT_VRAM_MB = 3000
+
+
+def _estimate_vram_mb(model_name: str) -> int:
+    """
+    Estimate VRAM usage from the parameter count in a model name.
+    
+    Mixture-of-experts tags count every expert, since all of them stay
+    resident. Experts share their attention weights, so "8x7b" overstates
+    the real ~47B, but both land in the largest bucket anyway.
+    
+    Args:
+        model_name: Ollama model name (e.g. 'qwen2.5:7b-instruct-q4_K_M')
+    
+    Returns:
+        Estimated VRAM in MB
+    """
+    match = _MODEL_SIZE_RE.search(model_name)
+    if match is None:
+        return _DEFAULT_VRAM_MB
+    
+    experts, size = match.groups()
+    size = float(size) * int(experts or 1)
+    return _VRAM_ESTIMATES_MB[bisect.bisect_left(_VRAM_SIZE_LIMITS, size)]
+
+
+async def _fetch_ollama_status(ollama_url: str) -> Dict[str, Any]:
+    """
+    Query the Ollama API for installed models and server version concurrently.
+    
+    Args:
+        ollama_url: Ollama base URL
+    
+    Returns:
+        Dictionary with the /api/tags body under "tags" and the server
+        version under "version" (None if the version endpoint failed)
+    """
+    async with httpx.AsyncClient(base_url=ollama_url, timeout=5.0) as client:
+        tags_response, version_response = await asyncio.gather(
+            client.get("/api/tags"),
+            client.get("/api/version"),
+            return_exceptions=True
+        )
+    
+    if isinstance(tags_response, Exception):
+        raise tags_response
+    tags_response.raise_for_status()
+    
+    version = None
+    if not isinstance(version_response, Exception) and version_response.status_code == 200:
+        version = version_response.json().get("version")
+    
+    return {"tags": tags_response.json(), "version": version}
+
+
+@lru_cache(maxsize=1)
+def _preflight_ok(ollama_url: str) -> Tuple[bool, str]:
+    """
+    Probe Ollama once per process.
+    
+    The probe runs on a background thread, so its report is returned
+    instead of printed and shown once the main thread collects it.
+    
+    Args:
+        ollama_url: Ollama base URL
+    
+    Returns:
+        Tuple of (True if Ollama is reachable, report text)
+    """
+    lines = ["\n[*] Running pre-flight checks..."]
+    
+    try:
+        status = asyncio.run(_fetch_ollama_status(ollama_url))
+    except httpx.TransportError as e:
+        lines.append(f"  [X] Cannot connect to Ollama at {ollama_url}")
+        lines.append(f"    Error: {e}")
+        lines.append("\n  Fix:")
+        lines.append("    1. Start Docker Desktop")
+        lines.append("    2. Run: docker-compose up -d")
+        lines.append("    3. Wait ~30 seconds for Ollama to start")
+        return False, "\n".join(lines)
+    except Exception as e:
+        lines.append(f"  [X] Unexpected error checking Ollama: {e}")
+        return False, "\n".join(lines)
+    
+    if status["version"]:
+        lines.append(f"  [OK] Ollama service is running (version {status['version']})")
+    else:
+        lines.append("  [OK] Ollama service is running")
+    
+    # Check if models are available
+    data = status["tags"]
+    if 'models' in data and len(data['models']) > 0:
+        lines.append(f"  [OK] Found {len(data['models'])} models")
+    else:
+        lines.append("  [!] No models found - first run may be slow")
+        lines.append("    Tip: Run 'bash scripts/pull_models.sh' to download models")
+    
+    return True, "\n".join(lines)
+
+
+def _run_preflight_checks(ui, config_loader) -> Tuple[bool, str]:
     """
     Run pre-flight checks to ensure system is ready.
     
+    A successful probe is remembered for the rest of the process; failures
+    are not cached so the next call probes Ollama again.
+    
     Args:
         ui: Progress UI instance
         config_loader: Configuration loader
     
     Returns:
-        True if all checks pass, False otherwise
+        Tuple of (True if all checks pass, report text to print)
+    """
+    logger.info("Running pre-flight system checks...")
+    ok, report = _preflight_ok(config_loader.get_ollama_base_url())
+    if not ok:
+        _preflight_ok.cache_clear()
+    return ok, report
+
+
+def _write_artifact_json(artifact: Dict[str, Any], json_path: Path) -> None:
+    """
+    Write an artifact as indented JSON.
+    
+    Uses orjson when installed, which serializes straight to bytes in C;
+    otherwise streams through the stdlib encoder.
+    
+    Args:
+        artifact: Artifact dictionary
+        json_path: Destination file
+    """
+    if orjson is not None:
+        data = orjson.dumps(
+            artifact,
+            default=str,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        )
+        with open(json_path, 'wb') as f:
+            f.write(data)
+        return
+    
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump(artifact, f, indent=2, default=str)
+
+
+def _await_preflight(preflight: Optional[Future], ui) -> bool:
+    """
+    Wait for a background pre-flight check and report a failure.
+    
+    Args:
+        preflight: Future returned by submitting _run_preflight_checks,
+            or None if the check was skipped or already awaited
+        ui: Progress UI instance
+    
+    Returns:
+        True if the checks passed or were skipped, False otherwise
+    """
+    if preflight is None:
+        return True
+    
+    # Printed here, on the main thread, so the report doesn't interleave
+    # with registration logs or the progress UI
+    ok, report = preflight.result()
+    print(report)
+    if ok:
+        return True
+    
+    ui.show_error("Pre-flight checks failed. Fix the issues above and try again.")
+    print("\nTip: Run diagnosis_script.py for detailed diagnostics")
+    print("Tip: Run scripts/start_services.ps1 to start Docker services")
+    return False
+
+
+def _prewarm_model(
+    model_manager,
+    preflight: Optional[Future],
+    model_name: str,
+    vram_mb: int,
+    agent_name: str
+) -> None:
     """
-    import urllib.request
-    import urllib.error
+    Load the first stage's model while the remaining agents are constructed.
     
-    print("\n[*] Running pre-flight checks...")
+    Waits for the pre-flight result first, so an unreachable Ollama is
+    reported once by the pre-flight check instead of retried here. Runs on
+    a background thread, so load progress goes to the logger only.
     
-    # Check Ollama connectivity
-    ollama_url = config_loader.get_ollama_base_url()
+    Args:
+        model_manager: Engine's model manager
+        preflight: Pre-flight future, or None if skipped or already awaited
+        model_name: Model to load
+        vram_mb: Expected VRAM usage in MB
+        agent_name: Agent the model is loaded for
+    """
+    if preflight is not None and not preflight.result()[0]:
+        return
     
     try:
-        req = urllib.request.Request(f"{ollama_url}/api/tags", method='GET')
-        with urllib.request.urlopen(req, timeout=5) as response:
-            if response.status == 200:
-                print("  [OK] Ollama service is running")
-                
-                # Check if models are available
-                import json
-                data = json.loads(response.read())
-                
-                if 'models' in data and len(data['models']) > 0:
-                    print(f"  [OK] Found {len(data['models'])} models")
-                else:
-                    print("  [!] No models found - first run may be slow")
-                    print("    Tip: Run 'bash scripts/pull_models.sh' to download models")
-                
-                return True
-    except urllib.error.URLError as e:
-        print(f"  [X] Cannot connect to Ollama at {ollama_url}")
-        print(f"    Error: {e.reason}")
-        print("\n  Fix:")
-        print("    1. Start Docker Desktop")
-        print("    2. Run: docker-compose up -d")
-        print("    3. Wait ~30 seconds for Ollama to start")
-        return False
+        model_manager.load_model(model_name, vram_mb, agent_name, announce=False)
     except Exception as e:
-        print(f"  [X] Unexpected error checking Ollama: {e}\")")
-        return False
+        # The first generate() call loads the model again and reports errors
+        logger.warning(f"Pre-warming {model_name} failed: {e}")
 
 
+async def _write_fallback_outputs(
+    artifact: Dict[str, Any],
+    json_path: Path,
+    markdown_path: Path,
+    markdown: str
+) -> None:
+    """
+    Write the raw JSON artifact and its markdown stub concurrently.
+    
+    Args:
+        artifact: Artifact dictionary
+        json_path: Destination for the raw JSON
+        markdown_path: Destination for the markdown stub
+        markdown: Markdown stub content
+    """
+    await asyncio.gather(
+        asyncio.to_thread(_write_artifact_json, artifact, json_path),
+        asyncio.to_thread(markdown_path.write_text, markdown, encoding='utf-8')
+    )
+
 
 def main():
     """Main entry point for ZenKnowledgeForge CLI."""
@@ -94,10 +317,15 @@ def main():
     # Determine log level
     log_level = get_log_level(args)
     
+    # One tag per run, shared by the log and output filenames so the two can
+    # be matched up afterwards. The monotonic-clock suffix keeps runs started
+    # within the same second from overwriting each other's files.
+    run_tag = f"{datetime.now():%Y%m%d_%H%M%S}_{time.monotonic_ns() & 0xffff:04x}"
+    
     # Setup logging
     log_file = None
     if not args.quiet:
-        log_file = Path("logs") / f"zen_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        log_file = Path("logs") / f"zen_{run_tag}.log"
     
     setup_logging(
         level=log_level,
@@ -134,13 +362,22 @@ def main():
             print("\n[OK] Configuration valid")
             return 0
         
-        # Pre-flight checks
-        logger.info("Running pre-flight system checks...")
-        if not _run_preflight_checks(ui, config_loader):
-            ui.show_error("Pre-flight checks failed. Fix the issues above and try again.")
-            print("\nTip: Run diagnosis_script.py for detailed diagnostics")
-            print("Tip: Run scripts/start_services.ps1 to start Docker services")
-            return 1
+        # Pre-flight checks run in the background so the Ollama round trip
+        # overlaps engine and agent construction. Anything that talks to
+        # Ollama or prompts the user waits for the result first.
+        preflight = None
+        if args.skip_preflight:
+            logger.info("Skipping pre-flight system checks")
+        else:
+            preflight_pool = ThreadPoolExecutor(max_workers=1)
+            preflight = preflight_pool.submit(_run_preflight_checks, ui, config_loader)
+            preflight_pool.shutdown(wait=False)
+        
+        if args.single_model or args.interactive:
+            preflight_ok = _await_preflight(preflight, ui)
+            preflight = None
+            if not preflight_ok:
+                return 1
         
         # Single model mode - interactive selection
         single_model_name = None
@@ -170,11 +407,12 @@ def main():
             print("   Quality: Good for most queries\n")
         
         # Get user brief
-        if args.interactive:
+        user_brief = args.brief
+        if args.interactive and not user_brief:
+            from .cli.interactive import InteractiveMode
+            
             interactive = InteractiveMode(use_rich=not args.no_rich)
-            user_brief = args.brief or interactive.get_brief()
-        else:
-            user_brief = args.brief
+            user_brief = interactive.get_brief()
         
         if not user_brief:
             ui.show_error("No brief provided")
@@ -195,90 +433,66 @@ def main():
             # Load agent configurations
             agents_config = config_loader.load_agents_config()
             
-            # Register agents
+            # Get pipeline steps for the mode
+            mode = ExecutionMode(args.mode)
+            pipeline_steps = engine.get_pipeline_steps(mode)
+            
+            # Register only the agents this pipeline runs
             logger.info("Registering agents...")
+            needed_agents = set(pipeline_steps)
             
             # Determine VRAM estimate for single model mode
             if single_model_name:
-                # Use a conservative estimate based on model name
-                if "14b" in single_model_name or "13b" in single_model_name:
-                    single_model_vram = 9000
-                elif "9b" in single_model_name or "8b" in single_model_name:
-                    single_model_vram = 5500
-                elif "7b" in single_model_name:
-                    single_model_vram = 4500
-                else:
-                    single_model_vram = 3000
-            
-            # Create and register each agent
-            interpreter_cfg = agents_config.agents["interpreter"]
-            engine.register_agent(
-                "interpreter",
-                InterpreterAgent(
-                    model_name=single_model_name or interpreter_cfg.model,
-                    vram_mb=single_model_vram if single_model_name else interpreter_cfg.vram_mb,
-                    temperature=interpreter_cfg.temperature,
-                    max_questions=interpreter_cfg.max_questions or 5
-                )
-            )
+                single_model_vram = _estimate_vram_mb(single_model_name)
             
-            planner_cfg = agents_config.agents["planner"]
-            engine.register_agent(
-                "planner",
-                PlannerAgent(
-                    model_name=single_model_name or planner_cfg.model,
-                    vram_mb=single_model_vram if single_model_name else planner_cfg.vram_mb,
-                    temperature=planner_cfg.temperature,
-                    max_research_questions=planner_cfg.max_research_questions or 5
-                )
-            )
-            
-            grounder_cfg = agents_config.agents["grounder"]
-            engine.register_agent(
-                "grounder",
-                GrounderAgent(
-                    model_name=single_model_name or grounder_cfg.model,
-                    vram_mb=single_model_vram if single_model_name else grounder_cfg.vram_mb,
-                    temperature=grounder_cfg.temperature,
-                    max_sources=grounder_cfg.max_sources or 10
-                )
-            )
-            
-            auditor_cfg = agents_config.agents["auditor"]
-            engine.register_agent(
-                "auditor",
-                AuditorAgent(
-                    model_name=single_model_name or auditor_cfg.model,
-                    vram_mb=single_model_vram if single_model_name else auditor_cfg.vram_mb,
-                    temperature=auditor_cfg.temperature
-                )
-            )
+            # Load the first stage's model in the background; only one model
+            # fits in VRAM, so later stages still load on demand
+            first_agent = pipeline_steps[0]
+            first_cfg = agents_config.agents[first_agent]
+            if single_model_name:
+                warm_model, warm_vram = single_model_name, single_model_vram
+            else:
+                warm_model, warm_vram = first_cfg.model, first_cfg.vram_mb
+            warm_model, warm_vram = engine.model_manager.resolve_model(warm_model, warm_vram)
             
-            visualizer_cfg = agents_config.agents["visualizer"]
-            engine.register_agent(
-                "visualizer",
-                VisualizerAgent(
-                    model_name=single_model_name or visualizer_cfg.model,
-                    vram_mb=single_model_vram if single_model_name else visualizer_cfg.vram_mb,
-                    temperature=visualizer_cfg.temperature
-                )
+            prewarm_pool = ThreadPoolExecutor(max_workers=1)
+            prewarm_pool.submit(
+                _prewarm_model, engine.model_manager, preflight,
+                warm_model, warm_vram, first_agent
             )
+            prewarm_pool.shutdown(wait=False)
             
-            judge_cfg = agents_config.agents["judge"]
-            engine.register_agent(
-                "judge",
-                JudgeAgent(
-                    model_name=single_model_name or judge_cfg.model,
-                    vram_mb=single_model_vram if single_model_name else judge_cfg.vram_mb,
-                    temperature=judge_cfg.temperature,
-                    consensus_threshold=judge_cfg.consensus_threshold or 0.85,
-                    max_deliberation_rounds=judge_cfg.max_deliberation_rounds or 7
+            # Create and register each agent
+            for agent_name, class_name, extra_fields in _AGENT_SPECS:
+                if agent_name not in needed_agents:
+                    continue
+                
+                agent_class = _load_agent_class(agent_name, class_name)
+                agent_cfg = agents_config.agents[agent_name]
+                
+                if single_model_name:
+                    model_name, vram_mb = single_model_name, single_model_vram
+                else:
+                    model_name, vram_mb = agent_cfg.model, agent_cfg.vram_mb
+                
+                extra_kwargs = {
+                    field: getattr(agent_cfg, field) or default
+                    for field, default in extra_fields
+                }
+                
+                engine.register_agent(
+                    agent_name,
+                    agent_class(
+                        model_name=model_name,
+                        vram_mb=vram_mb,
+                        temperature=agent_cfg.temperature,
+                        cache_strategy=agent_cfg.cache_strategy,
+                        **extra_kwargs
+                    )
                 )
-            )
             
-            # Get pipeline steps for the mode
-            mode = ExecutionMode(args.mode)
-            pipeline_steps = engine.get_pipeline_steps(mode)
+            if not _await_preflight(preflight, ui):
+                return 1
             
             logger.info(f"Pipeline: {' -> '.join(pipeline_steps)}")
             
@@ -311,6 +525,8 @@ def main():
             # Render the artifact
             logger.info("Rendering final artifact...")
             
+            from .renderers.markdown import MarkdownRenderer
+            
             renderer = MarkdownRenderer()
             
             # Determine output path
@@ -322,8 +538,7 @@ def main():
                 output_dir.mkdir(parents=True, exist_ok=True)
                 
                 # Generate filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                filename = f"{args.mode}_{timestamp}.md"
+                filename = f"{args.mode}_{run_tag}.md"
                 output_path = output_dir / filename
             
             # Try rendering with template, fallback to raw JSON if fails
@@ -337,13 +552,9 @@ def main():
                 logger.warning(f"Template rendering failed: {render_error}")
                 logger.info("Falling back to raw artifact save...")
                 
-                # Save raw artifact as JSON
-                import json
+                # Save raw artifact as JSON, plus a simple markdown version
                 json_path = Path(output_path).with_suffix('.json')
-                with open(json_path, 'w', encoding='utf-8') as f:
-                    json.dump(final_artifact, f, indent=2, default=str)
                 
-                # Also create a simple markdown version
                 simple_md = f"""# ZenKnowledgeForge Research Output
 
 **Generated:** {datetime.now().isoformat()}
@@ -357,8 +568,9 @@ def main():
 
 See: {json_path}
 """
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    f.write(simple_md)
+                asyncio.run(_write_fallback_outputs(
+                    final_artifact, json_path, Path(output_path), simple_md
+                ))
                 
                 ui.show_warning(f"Template failed - Raw output saved to: {json_path}")
             
@@ -374,6 +586,8 @@ See: {json_path}
         return 130
     
     except Exception as e:
+        # Ollama may have gone away mid-run; don't trust the cached probe
+        _preflight_ok.cache_clear()
         logger.exception("Fatal error during execution")
         ui.show_error(f"Fatal error: {str(e)}")
         return 1
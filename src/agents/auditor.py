@@ -25,7 +25,8 @@ class AuditorAgent(BaseAgent):
         self,
         model_name: str = "gemma2:9b-instruct-q4_K_M",
         vram_mb: int = 5500,
-        temperature: float = 0.3
+        temperature: float = 0.3,
+        cache_strategy: str = "off"
     ):
         """
         Initialize the Auditor agent.
@@ -34,12 +35,14 @@ class AuditorAgent(BaseAgent):
             model_name: Ollama model name
             vram_mb: Expected VRAM usage
             temperature: Sampling temperature
+            cache_strategy: Response cache strategy ("exact" or "off")
         """
         super().__init__(
             name="Auditor",
             model_name=model_name,
             vram_mb=vram_mb,
-            temperature=temperature
+            temperature=temperature,
+            cache_strategy=cache_strategy
         )
         
         # Load prompt template
@@ -67,7 +70,7 @@ class AuditorAgent(BaseAgent):
         # Build the full prompt
         prompt = f"{self.prompt_template}\n\n"
         prompt += f"## Input\n\n"
-        prompt += f"```json\n{self.prompt_engine.inject_variables('{input}', {'input': input_json})}\n```\n\n"
+        prompt += f"```json\n{self.prompt_engine.format_json(input_json)}\n```\n\n"
         prompt += f"## Your Response\n\n"
         prompt += f"Provide your response as valid JSON only:"
         
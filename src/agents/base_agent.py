@@ -3,10 +3,31 @@ Base Agent - Abstract class for all agents.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
+import hashlib
 import json
 import logging
+import os
 import re
+import threading
+import time
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON parsing/serialization
+    orjson = None
+
+try:
+    # jiter-backed parser shipped with pydantic. Older releases reject the
+    # allow_partial keyword (TypeError) or the 'trailing-strings' mode
+    # (ValueError); probe once so the fallback is simply skipped there
+    from pydantic_core import from_json as _from_json_partial
+    _from_json_partial('{"probe": "', allow_partial='trailing-strings')
+except (ImportError, TypeError, ValueError):
+    _from_json_partial = None
 
 from ..orchestration.state import SharedState
 from ..orchestration.model_manager import ModelManager
@@ -14,6 +35,164 @@ from ..orchestration.model_manager import ModelManager
 
 logger = logging.getLogger(__name__)
 
+# Appended to the prompt after a response fails to parse
+_STRICT_JSON_SUFFIX = (
+    "\n\nIMPORTANT: Your previous response could not be parsed. "
+    "Please respond with ONLY valid JSON, no markdown, no explanations."
+)
+
+# {identifier} placeholders in prompt templates
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+# JSON repair passes in extract_json_from_response()
+_CTRL_CHAR_RE = re.compile(r'[\x00-\x1f\x7f-\x9f]')
+_CTRL_CHAR_TABLE = dict.fromkeys([*range(0x20), *range(0x7f, 0xa0)])
+
+# A '{' that can open a JSON object: a key or the closing brace follows,
+# which skips braces in prose such as "use {name} placeholders"
+_OBJECT_START_RE = re.compile(r'\{\s*["}]')
+_TRAILING_COMMA_RE = re.compile(r',(\s*[}\]])')
+
+# Exact-match cache of raw responses that parsed, keyed on model,
+# temperature and prompt; shared by all agents, least recently used first
+_RESPONSE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESPONSE_CACHE_SIZE = 64
+_response_cache_lock = threading.Lock()
+
+CACHE_STRATEGIES = ("off", "exact")
+
+# raw_decode() parses the first complete value at an offset and ignores
+# whatever follows it
+_JSON_DECODER = json.JSONDecoder()
+
+
+if orjson is not None:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # keep catching the stdlib exception
+    _json_loads = orjson.loads
+
+    def _json_dumps_indented(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+    def _json_dumps_compact(value: Any) -> str:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+else:
+    _json_loads = json.loads
+
+    def _json_dumps_indented(value: Any) -> str:
+        return json.dumps(value, indent=2)
+
+    def _json_dumps_compact(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+@lru_cache(maxsize=128)
+def _compile_template(template: str) -> Tuple[str, ...]:
+    """Split a template once into alternating literal and placeholder segments."""
+    return tuple(_PLACEHOLDER_RE.split(template))
+
+
+@lru_cache(maxsize=32)
+def _read_template(template_path: str, mtime_ns: int) -> str:
+    """Read a prompt template; keyed on mtime so edited files are re-read."""
+    return Path(template_path).read_text(encoding='utf-8')
+
+
+# _repair_unescaped_quotes() scanner states
+_OUTSIDE, _IN_KEY, _AFTER_COLON, _IN_VALUE = range(4)
+
+
+def _repair_unescaped_quotes(text: str) -> str:
+    """
+    Escape stray double quotes inside string values in one linear pass.
+    
+    A quote inside a value only closes it when the next non-space
+    character is ',', '}' or ']' (or the text ends); any other quote is
+    written out escaped, e.g. "content": "text with "quotes" inside".
+    
+    Args:
+        text: Candidate JSON text
+    
+    Returns:
+        Text with inner quotes escaped
+    """
+    out = []
+    state = _OUTSIDE
+    escaped = False
+    n = len(text)
+    
+    for i, ch in enumerate(text):
+        if state == _IN_KEY or state == _IN_VALUE:
+            if escaped:
+                escaped = False
+            elif ch == '\\':
+                escaped = True
+            elif ch == '"':
+                if state == _IN_KEY:
+                    state = _OUTSIDE
+                else:
+                    j = i + 1
+                    while j < n and text[j].isspace():
+                        j += 1
+                    if j == n or text[j] in ',}]':
+                        state = _OUTSIDE
+                    else:
+                        out.append('\\"')
+                        continue
+        elif ch == '"':
+            state = _IN_VALUE if state == _AFTER_COLON else _IN_KEY
+        elif ch == ':':
+            state = _AFTER_COLON
+        elif not ch.isspace():
+            state = _OUTSIDE
+        out.append(ch)
+    
+    return ''.join(out)
+
+
+class _JsonObjectTracker:
+    """
+    Incremental brace-depth counter over streamed text.
+    
+    Braces inside JSON strings are ignored; quotes outside an object are
+    treated as prose.
+    """
+    
+    def __init__(self):
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+    
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume a chunk of text.
+        
+        Args:
+            chunk: Next piece of the response
+        
+        Returns:
+            True if a top-level object closed within this chunk
+        """
+        closed = False
+        
+        for ch in chunk:
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif ch == '\\':
+                    self.escaped = True
+                elif ch == '"':
+                    self.in_string = False
+            elif ch == '{':
+                self.depth += 1
+            elif ch == '}' and self.depth:
+                self.depth -= 1
+                closed = closed or self.depth == 0
+            elif ch == '"' and self.depth:
+                self.in_string = True
+        
+        return closed
+
 
 class PromptEngine:
     """
@@ -26,26 +205,50 @@ class PromptEngine:
         Inject variables into a prompt template.
         
         Args:
-            template: Prompt template with {variable} placeholders
+            template: Prompt template with {identifier} placeholders
             variables: Dictionary of variable values
         
         Returns:
             Formatted prompt
         """
-        prompt = template
+        # Odd segments are placeholder names, even segments literal text
+        parts = list(_compile_template(template))
+        rendered: Dict[str, str] = {}
         
-        for key, value in variables.items():
-            placeholder = f"{{{key}}}"
+        for i in range(1, len(parts), 2):
+            key = parts[i]
             
-            # Convert value to string appropriately
-            if isinstance(value, dict) or isinstance(value, list):
-                value_str = json.dumps(value, indent=2)
-            else:
-                value_str = str(value)
+            if key not in variables:
+                # Leave unknown placeholders untouched
+                parts[i] = f"{{{key}}}"
+                continue
+            
+            if key not in rendered:
+                value = variables[key]
+                
+                # Convert value to string appropriately
+                if isinstance(value, dict) or isinstance(value, list):
+                    rendered[key] = _json_dumps_indented(value)
+                else:
+                    rendered[key] = str(value)
             
-            prompt = prompt.replace(placeholder, value_str)
+            parts[i] = rendered[key]
         
-        return prompt
+        return ''.join(parts)
+    
+    @staticmethod
+    def format_json(value: Any, indent: bool = True) -> str:
+        """
+        Serialize a prompt input as JSON.
+        
+        Args:
+            value: JSON-serializable value
+            indent: Indent by two spaces; False gives compact single-line JSON
+        
+        Returns:
+            JSON text
+        """
+        return _json_dumps_indented(value) if indent else _json_dumps_compact(value)
     
     @staticmethod
     def extract_json_from_response(response: str) -> Optional[Dict[str, Any]]:
@@ -61,54 +264,89 @@ class PromptEngine:
         # Helper to try parsing
         def try_parse(text: str) -> Optional[Dict[str, Any]]:
             try:
-                return json.loads(text)
+                return _json_loads(text)
             except json.JSONDecodeError:
                 return None
         
-        # 1. Try extracting from markdown blocks first (most reliable)
-        json_pattern = r'```(?:json)?\s*(\{.*?\})\s*```'
-        matches = re.findall(json_pattern, response, re.DOTALL)
-        if matches:
-            parsed = try_parse(matches[0])
+        # 0. Fast path: the whole response is already a bare JSON object
+        stripped = response.strip()
+        if stripped.startswith('{') and stripped.endswith('}'):
+            parsed = try_parse(stripped)
             if parsed: return parsed
 
-        # 2. Try simple extraction of outer braces
-        start = response.find('{')
+        # Parse the first balanced object at an offset; the C scanner skips
+        # braces inside strings and stops at the closing brace
+        def try_decode_at(pos: int) -> Optional[Dict[str, Any]]:
+            try:
+                return _JSON_DECODER.raw_decode(response, pos)[0]
+            except json.JSONDecodeError:
+                return None
+        
+        # 1. Try objects opening a ``` or ```json block first (most reliable)
+        fence = response.find('```')
+        while fence != -1:
+            pos = fence + 3
+            if response.startswith('json', pos):
+                pos += 4
+            while pos < len(response) and response[pos].isspace():
+                pos += 1
+            
+            if response.startswith('{', pos):
+                parsed = try_decode_at(pos)
+                if parsed: return parsed
+            
+            fence = response.find('```', pos)
+
+        # 2. Try the first object anywhere in the response
+        match = _OBJECT_START_RE.search(response)
+        start = match.start() if match else response.find('{')
+        if start != -1:
+            parsed = try_decode_at(start)
+            if parsed: return parsed
+
+        # 3. Repair the outer-brace span; a clean span would already have
+        # parsed in step 2
         end = response.rfind('}')
         if start != -1 and end != -1 and end > start:
             json_candidate = response[start:end+1]
-            parsed = try_parse(json_candidate)
-            if parsed: return parsed
             
-            # 3. Simple repair: Fix common issues
+            # Simple repair: Fix common issues
             # Remove control characters
-            repaired = re.sub(r'[\x00-\x1f\x7f-\x9f]', '', json_candidate)
+            # str.translate takes an ASCII-only fast path; on non-ASCII
+            # text its per-character dict lookups are slower than the regex
+            if json_candidate.isascii():
+                repaired = json_candidate.translate(_CTRL_CHAR_TABLE)
+            else:
+                repaired = _CTRL_CHAR_RE.sub('', json_candidate)
             # Fix trailing commas
-            repaired = re.sub(r',(\s*[}\]])', r'\1', repaired)
+            repaired = _TRAILING_COMMA_RE.sub(r'\1', repaired)
             
             parsed = try_parse(repaired)
             if parsed: return parsed
             
-            # 4. Aggressive repair for unescaped quotes (common in long text)
-            # This is complex but handles "content": "text with "quotes" inside"
+            # 4. Aggressive repair for unescaped quotes (common in long text),
+            # e.g. "content": "text with "quotes" inside"
+            parsed = try_parse(_repair_unescaped_quotes(repaired))
+            if parsed: return parsed
+
+        # 5. Partial parse: recover the complete fields of an object that
+        # was cut off (e.g. at num_predict) instead of regenerating it. Only
+        # end-of-input is tolerated; malformed JSON still raises. The last
+        # top-level member is the one being written when output stopped and
+        # may be a half-filled nested object, so it is always dropped; a
+        # truncated required field then fails validation and is retried
+        if start != -1 and _from_json_partial is not None:
             try:
-                # Basic strategy: If we fail, try to escape inner quotes
-                # This is a heuristic and may not work for all cases
-                def escape_inner_quotes(match):
-                    content = match.group(1)
-                    # Don't escape already escaped quotes
-                    content = re.sub(r'(?<!\\)"', r'\"', content)
-                    return f': "{content}"'
-                
-                # Look for key-value pairs where value is a string
-                # This regex is fragile but helps in many cases
-                aggressive_repair = re.sub(r':\s*"(.*?)"(?=\s*[,}])', escape_inner_quotes, json_candidate, flags=re.DOTALL)
-                parsed = try_parse(aggressive_repair)
+                parsed = _from_json_partial(
+                    response[start:], allow_partial='trailing-strings'
+                )
+            except ValueError:
+                parsed = None
+            if isinstance(parsed, dict) and parsed:
+                parsed.popitem()
                 if parsed: return parsed
-            except Exception:
-                pass
 
-        # 5. Last resort: Return None if all recovery attempts fail
+        # 6. Last resort: Return None if all recovery attempts fail
         return None
 
 
@@ -122,13 +360,17 @@ class BaseAgent(ABC):
     - _parse_response(): Parse the LLM's response
     """
     
+    # PromptEngine only has static methods, so one instance serves all agents
+    prompt_engine = PromptEngine()
+    
     def __init__(
         self,
         name: str,
         model_name: str,
         vram_mb: int,
         temperature: float = 0.3,
-        max_retries: int = 3
+        max_retries: int = 3,
+        cache_strategy: str = "off"
     ):
         """
         Initialize the agent.
@@ -139,16 +381,23 @@ class BaseAgent(ABC):
             vram_mb: Expected VRAM usage in MB
             temperature: Sampling temperature
             max_retries: Maximum retries for JSON parsing
+            cache_strategy: "exact" reuses the response to an identical
+                prompt on the same model and temperature; "off" always
+                generates
         """
+        if cache_strategy not in CACHE_STRATEGIES:
+            raise ValueError(
+                f"cache_strategy must be one of {CACHE_STRATEGIES}, got {cache_strategy!r}"
+            )
+        
         self.name = name
         self.model_name = model_name
         self.vram_mb = vram_mb
         self.temperature = temperature
         self.max_retries = max_retries
+        self.cache_strategy = cache_strategy
         
-        self.prompt_engine = PromptEngine()
-        
-        logger.debug(f"Initialized {self.name} agent with model {self.model_name}")
+        logger.debug("Initialized %s agent with model %s", self.name, self.model_name)
     
     def think(
         self,
@@ -165,34 +414,44 @@ class BaseAgent(ABC):
         Returns:
             Agent's output as a dictionary
         """
-        logger.info(f"{self.name} is thinking...")
+        logger.info("%s is thinking...", self.name)
         
         # Prepare the prompt
-        prompt = self._prepare_prompt(state)
+        base_prompt = prompt = self._prepare_prompt(state)
+        
+        cache_key = None
+        if self.cache_strategy == "exact":
+            cache_key = self._response_cache_key(base_prompt)
+            with _response_cache_lock:
+                cached = _RESPONSE_CACHE.get(cache_key)
+                if cached is not None:
+                    _RESPONSE_CACHE.move_to_end(cache_key)
+            
+            # Parsed again rather than cached parsed, so the caller gets a
+            # fresh dict and _parse_response still sees the current state
+            parsed = self._parse_response(cached, state) if cached is not None else None
+            if parsed is not None:
+                logger.info("%s reused a cached response", self.name)
+                return parsed
         
         # Generate response with retry logic
         for attempt in range(self.max_retries):
             try:
                 logger.debug(
-                    f"{self.name} generating response (attempt {attempt + 1})"
+                    "%s generating response (attempt %d)", self.name, attempt + 1
                 )
                 
-                # Generate with the model
-                response = model_manager.generate(
-                    model_name=self.model_name,
-                    prompt=prompt,
-                    vram_mb=self.vram_mb,
-                    agent_name=self.name.lower(),
-                    temperature=self.temperature
-                )
+                # Stream from the model, parsing as soon as the JSON closes
+                response, parsed = self._generate_and_parse(prompt, state, model_manager)
                 
-                logger.debug(f"{self.name} received response: {response[:200]}...")
-                
-                # Parse the response
-                parsed = self._parse_response(response, state)
+                # Skip the slice as well as the formatting when debug is off
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("%s received response: %s...", self.name, response[:200])
                 
                 if parsed is not None:
-                    logger.info(f"{self.name} successfully produced output")
+                    logger.info("%s successfully produced output", self.name)
+                    if cache_key is not None:
+                        self._cache_response(cache_key, response)
                     return parsed
                 else:
                     logger.warning(
@@ -200,13 +459,9 @@ class BaseAgent(ABC):
                     )
                     
                     if attempt < self.max_retries - 1:
-                        # Add instruction to return valid JSON
-                        prompt = (
-                            f"{prompt}\n\n"
-                            f"IMPORTANT: Your previous response could not be parsed. "
-                            f"Please respond with ONLY valid JSON, no markdown, "
-                            f"no explanations."
-                        )
+                        # Add instruction to return valid JSON (once; later
+                        # retries reuse the same prompt)
+                        prompt = base_prompt + _STRICT_JSON_SUFFIX
                 
             except Exception as e:
                 logger.error(
@@ -229,14 +484,72 @@ class BaseAgent(ABC):
                     return self._graceful_degradation(state)
                 
                 # Wait before retry
-                import time
                 wait_time = 2 ** attempt  # Exponential backoff
-                logger.info(f"Waiting {wait_time}s before retry...")
+                logger.info("Waiting %ds before retry...", wait_time)
                 time.sleep(wait_time)
         
         # If all retries failed, return a graceful degradation
         logger.error(f"{self.name} failed after {self.max_retries} attempts")
         return self._graceful_degradation(state)
+
+    def _response_cache_key(self, prompt: str) -> str:
+        """Hash the inputs that determine a response."""
+        key = f"{self.model_name}\0{self.temperature}\0{prompt}"
+        return hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    
+    @staticmethod
+    def _cache_response(cache_key: str, response: str) -> None:
+        """Store a response that parsed, evicting the least recently used."""
+        with _response_cache_lock:
+            _RESPONSE_CACHE[cache_key] = response
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+                _RESPONSE_CACHE.popitem(last=False)
+    
+    def _generate_and_parse(
+        self,
+        prompt: str,
+        state: SharedState,
+        model_manager: ModelManager
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Stream a response and parse it, stopping generation early once a
+        complete top-level JSON object passes _parse_response().
+        
+        Args:
+            prompt: Prompt to send to the model
+            state: Current shared state
+            model_manager: Model manager for LLM access
+        
+        Returns:
+            Tuple of (raw response, parsed output or None)
+        """
+        chunks = []
+        tracker = _JsonObjectTracker()
+        stream = model_manager.generate_stream(
+            model_name=self.model_name,
+            prompt=prompt,
+            vram_mb=self.vram_mb,
+            agent_name=self.name.lower(),
+            temperature=self.temperature
+        )
+        
+        try:
+            for chunk in stream:
+                chunks.append(chunk)
+                
+                if tracker.feed(chunk):
+                    response = ''.join(chunks)
+                    parsed = self._parse_response(response, state)
+                    if parsed is not None:
+                        logger.debug("%s got complete JSON, stopping generation", self.name)
+                        return response, parsed
+        finally:
+            # Closes the HTTP stream if we stopped early
+            stream.close()
+        
+        response = ''.join(chunks)
+        return response, self._parse_response(response, state)
     
     @abstractmethod
     def _prepare_prompt(self, state: SharedState) -> str:
@@ -286,21 +599,23 @@ class BaseAgent(ABC):
             "degraded": True
         }
     
-    def load_prompt_template(self, template_path: str) -> str:
+    @classmethod
+    def load_prompt_template(cls, template_path: str) -> str:
         """
         Load a prompt template from file.
         
+        Every instance, of any agent class, gets the same cached string, so
+        a template is held in memory once however many agents are built.
+        
         Args:
             template_path: Path to the template file
         
         Returns:
             Template content
         """
-        from pathlib import Path
-        
-        template_file = Path(template_path)
-        if not template_file.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
+        try:
+            mtime_ns = os.stat(template_path).st_mtime_ns
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Template not found: {template_path}") from None
         
-        with open(template_file, 'r') as f:
-            return f.read()
+        return _read_template(template_path, mtime_ns)
@@ -2,10 +2,16 @@
 Grounder Agent - RAG retrieval, evidence citation, confidence scoring.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from pathlib import Path
+import hashlib
+import heapq
 import logging
 import json
+import pickle
+import time
+from operator import itemgetter
 
 from .base_agent import BaseAgent, PromptEngine
 from ..orchestration.state import SharedState
@@ -14,6 +20,75 @@ from ..tools import VectorStore, CachedWebSearch, CitationManager
 
 logger = logging.getLogger(__name__)
 
+# Research questions searched at once; DuckDuckGo rate-limits bursts
+_MAX_SEARCH_WORKERS = 4
+
+# Ranking key for evidence sources; every source sets relevance_score
+_relevance = itemgetter('relevance_score')
+
+# Cached vector results kept on disk; the oldest are deleted beyond this
+_EVIDENCE_CACHE_MAX_FILES = 512
+
+# Characters of each source kept in state.evidence and shown in the prompt
+_CONTENT_CHARS = 1000
+_PREVIEW_CHARS = 500
+
+# Static parts of the Grounder prompt. They are placed ahead of the per-run
+# input and evidence so consecutive calls share the longest possible
+# prompt prefix, which Ollama can reuse from its KV cache.
+_ANSWER_INSTRUCTIONS = """## Instructions
+
+CRITICAL DIRECTIVE: Provide comprehensive, evidence-backed answers for each research question.
+
+For EACH research question, provide:
+1. A clear, detailed answer (3-5 paragraphs, 300-500 words per question)
+2. Technical analysis explaining key principles and mechanisms
+3. Real-world examples (2-3) with specific use cases
+4. Key findings with supporting evidence from retrieved sources
+5. Related concepts and interconnections
+6. Implementation guidance and best practices
+7. Common challenges and solutions
+8. Future trends and directions
+
+**CITATION REQUIREMENTS**:
+- Reference sources using [Source N] markers (e.g., "According to [Source 1]...")
+- Integrate evidence naturally into your narrative
+- Prioritize information from provided sources
+- Cite sources for all factual claims when available
+
+Focus on depth, accuracy, and evidence-based reasoning.
+Target: 2000-4000 words total for all questions combined.
+Every claim should be substantiated with citations or reasoning.
+"""
+
+_CONTENT_REQUIREMENTS = """## Content Requirements
+
+**CRITICAL DIRECTIVE**: Provide comprehensive, evidence-backed answers. Each research question requires:
+- Clear explanation (3-5 paragraphs, 300-500 words)
+- Technical analysis explaining key concepts and mechanisms
+- Real-world examples (2-3) with specific use cases from sources
+- Implementation guidance: practical patterns and best practices
+- Common challenges with solutions
+- Future directions and emerging trends
+- **CITE all factual claims using [Source N] markers**
+
+TARGET: 2000-4000 words total for all questions combined.
+Focus on clarity, accuracy, and practical value.
+Every claim must be substantiated with evidence from sources or reasoning.
+Provide actionable insights that users can apply.
+"""
+
+# Replaces both blocks above when retrieval found nothing: there are no
+# [Source N] markers to cite, so the citation and depth requirements
+# would only invite invented references
+_NO_EVIDENCE_INSTRUCTIONS = """## Instructions
+
+No sources could be retrieved for these research questions. Answer each one from general knowledge:
+- Give a clear answer with key findings, examples and practical guidance
+- Do not invent [Source N] markers, URLs or citations
+- Keep confidence scores low (0.4-0.6) to reflect the missing evidence
+"""
+
 
 class GrounderAgent(BaseAgent):
     """
@@ -28,7 +103,10 @@ class GrounderAgent(BaseAgent):
         model_name: str = "qwen2.5:7b-instruct-q4_K_M",
         vram_mb: int = 4500,
         temperature: float = 0.2,
-        max_sources: int = 10
+        max_sources: int = 10,
+        cache_strategy: str = "off",
+        evidence_cache_dir: Optional[str] = "./cache/evidence",
+        evidence_cache_ttl_days: int = 7
     ):
         """
         Initialize the Grounder agent.
@@ -38,12 +116,17 @@ class GrounderAgent(BaseAgent):
             vram_mb: Expected VRAM usage
             temperature: Sampling temperature
             max_sources: Maximum sources to cite
+            cache_strategy: Response cache strategy ("exact" or "off")
+            evidence_cache_dir: Directory for per-question vector results
+                (None disables the evidence cache)
+            evidence_cache_ttl_days: Evidence cache time-to-live in days
         """
         super().__init__(
             name="Grounder",
             model_name=model_name,
             vram_mb=vram_mb,
-            temperature=temperature
+            temperature=temperature,
+            cache_strategy=cache_strategy
         )
         
         self.max_sources = max_sources
@@ -65,11 +148,169 @@ class GrounderAgent(BaseAgent):
         self.citation_manager = CitationManager()
         logger.info("Web search and citation manager initialized")
         
+        self.evidence_cache_dir = Path(evidence_cache_dir) if evidence_cache_dir else None
+        if self.evidence_cache_dir is not None:
+            self.evidence_cache_dir.mkdir(parents=True, exist_ok=True)
+        self.evidence_cache_ttl_days = evidence_cache_ttl_days
+        
         # Load prompt template
         config_dir = Path(__file__).parent.parent.parent / "config"
         template_path = config_dir / "prompts" / "grounder.md"
         self.prompt_template = self.load_prompt_template(str(template_path))
     
+    def _search_web(self, question: str, rq_id: str) -> List[Dict[str, Any]]:
+        """
+        Run the web search for one research question.
+        
+        Called from worker threads, so it only queries the backend;
+        citations and evidence are assembled by the caller.
+        
+        Args:
+            question: Research question text
+            rq_id: Research question ID, for logging
+        
+        Returns:
+            Web results, empty if the search failed
+        """
+        logger.info(f"Retrieving evidence for {rq_id}: {question}")
+        
+        try:
+            web_results = self.web_search.search(question, max_results=5)
+            logger.info(f"Found {len(web_results)} web results for {rq_id}")
+            return web_results
+        except Exception as e:
+            logger.error(f"Web search failed for {rq_id}: {e}")
+            return []
+    
+    def _search_vector_store(
+        self,
+        questions: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Search the vector database for all questions in one batched query.
+        
+        Args:
+            questions: Research question texts
+        
+        Returns:
+            Results per question, or None for each if the search failed or
+            no vector store is available
+        """
+        if not questions:
+            return []
+        if self.vector_store is None:
+            return [None] * len(questions)
+        
+        try:
+            batch = self.vector_store.search_batch(questions, n_results=5)
+        except Exception as e:
+            logger.warning(f"Vector search failed: {e}")
+            return [None] * len(questions)
+        
+        logger.info(
+            f"Found {sum(len(r.get('documents', [])) for r in batch)} vector DB results "
+            f"for {len(questions)} questions"
+        )
+        return batch
+    
+    def _collection_count(self) -> Optional[int]:
+        """
+        Number of documents in the vector collection.
+        
+        Part of the evidence cache key, so ingesting documents invalidates
+        cached vector results.
+        
+        Returns:
+            Document count, or None if no vector store is available
+        """
+        if self.vector_store is None:
+            return None
+        
+        try:
+            return self.vector_store.collection.count()
+        except Exception as e:
+            logger.warning(f"Could not read vector collection size: {e}")
+            return None
+    
+    def _evidence_cache_file(self, question: str, collection_count: int) -> Path:
+        """Cache file holding the vector results for one question."""
+        key = hashlib.blake2b(
+            f"{question}\0{collection_count}".encode(), digest_size=16
+        ).hexdigest()
+        return self.evidence_cache_dir / f"{key}.pkl"
+    
+    def _load_cached_vector_results(
+        self,
+        question: str,
+        collection_count: Optional[int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load the cached vector results for a question.
+        
+        Args:
+            question: Research question text
+            collection_count: Current document count of the collection
+        
+        Returns:
+            Vector results, or None on a miss or stale entry
+        """
+        if self.evidence_cache_dir is None or collection_count is None:
+            return None
+        
+        cache_file = self._evidence_cache_file(question, collection_count)
+        try:
+            age_days = (time.time() - cache_file.stat().st_mtime) / 86400
+            if age_days >= self.evidence_cache_ttl_days:
+                return None
+            with open(cache_file, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable evidence cache for: {question} ({e})")
+            return None
+    
+    def _cache_vector_results(
+        self,
+        fresh: Dict[str, Optional[Dict[str, Any]]],
+        collection_count: Optional[int]
+    ) -> None:
+        """
+        Cache freshly queried vector results, then prune the cache.
+        
+        Failed lookups (None) are not cached, so the knowledge base is
+        queried again once it is reachable.
+        
+        Args:
+            fresh: Vector results by question text
+            collection_count: Document count the results were queried at
+        """
+        if self.evidence_cache_dir is None or collection_count is None:
+            return
+        
+        for question, vector_results in fresh.items():
+            if vector_results is None:
+                continue
+            try:
+                with open(self._evidence_cache_file(question, collection_count), 'wb') as f:
+                    pickle.dump(vector_results, f)
+            except OSError as e:
+                logger.warning(f"Could not cache evidence for: {question} ({e})")
+        
+        self._prune_evidence_cache()
+    
+    def _prune_evidence_cache(self) -> None:
+        """Delete the oldest cache files beyond _EVIDENCE_CACHE_MAX_FILES."""
+        try:
+            files = sorted(
+                self.evidence_cache_dir.glob("*.pkl"),
+                key=lambda path: path.stat().st_mtime
+            )
+            for path in files[:-_EVIDENCE_CACHE_MAX_FILES]:
+                path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Could not prune evidence cache: {e}")
+    
     def _retrieve_evidence(
         self,
         research_questions: List[Dict[str, Any]]
@@ -77,6 +318,13 @@ class GrounderAgent(BaseAgent):
         """
         Retrieve evidence for all research questions.
         
+        Each distinct question is searched at most once per call. Vector
+        results cached for the collection's current size are reused; the
+        rest are queried in one batch while the web searches run
+        concurrently, at most _MAX_SEARCH_WORKERS at a time. Results are
+        then processed in question order so citation IDs stay
+        deterministic.
+        
         Args:
             research_questions: List of research question dictionaries
         
@@ -84,70 +332,92 @@ class GrounderAgent(BaseAgent):
             Dictionary mapping question IDs to evidence lists
         """
         all_evidence = {}
+        if not research_questions:
+            return all_evidence
         
-        for rq in research_questions:
-            question = rq.get('question', '')
-            rq_id = rq.get('id', 'RQ_unknown')
-            
-            logger.info(f"Retrieving evidence for {rq_id}: {question}")
+        questions = [rq.get('question', '') for rq in research_questions]
+        rq_ids = [rq.get('id', 'RQ_unknown') for rq in research_questions]
+        
+        # Identical question texts (the Planner sometimes repeats itself)
+        # are looked up and searched once and share the results
+        first_rq_ids = {}
+        for question, rq_id in zip(questions, rq_ids):
+            first_rq_ids.setdefault(question, rq_id)
+        distinct = list(first_rq_ids)
+        
+        # Web results are cached by CachedWebSearch; only the vector half
+        # is cached here
+        collection_count = self._collection_count()
+        vector_results_by_question = {
+            question: self._load_cached_vector_results(question, collection_count)
+            for question in distinct
+        }
+        vector_misses = [q for q, cached in vector_results_by_question.items() if cached is None]
+        logger.info(
+            f"Evidence cache: {len(distinct) - len(vector_misses)} hits, "
+            f"{len(vector_misses)} misses"
+        )
+        
+        workers = min(_MAX_SEARCH_WORKERS, len(distinct))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            web_searches = pool.map(
+                self._search_web, distinct, [first_rq_ids[q] for q in distinct]
+            )
+            fresh = dict(zip(vector_misses, self._search_vector_store(vector_misses)))
+            web_results_by_question = dict(zip(distinct, web_searches))
+        
+        vector_results_by_question.update(fresh)
+        self._cache_vector_results(fresh, collection_count)
+        
+        for rq_id, question in zip(rq_ids, questions):
+            vector_results = vector_results_by_question[question]
+            web_results = web_results_by_question[question]
             evidence_sources = []
             
-            # 1. Search vector database (if available)
-            if self.vector_store is not None:
-                try:
-                    vector_results = self.vector_store.search(question, n_results=5)
-                    
-                    # Process vector DB results
-                    for i, (doc, metadata, distance) in enumerate(zip(
-                        vector_results.get('documents', []),
-                        vector_results.get('metadatas', []),
-                        vector_results.get('distances', [])
-                    )):
-                        evidence_sources.append({
-                            'source': 'vector_db',
-                            'content': doc[:1000],  # First 1K chars
-                            'metadata': metadata,
-                            'relevance_score': 1.0 - distance,  # Convert distance to similarity
-                            'title': metadata.get('title', 'Knowledge Base Document')
-                        })
-                    
-                    logger.info(f"Found {len(vector_results.get('documents', []))} vector DB results for {rq_id}")
-                except Exception as e:
-                    logger.warning(f"Vector search failed for {rq_id}: {e}")
-            
-            # 2. Search web
-            try:
-                web_results = self.web_search.search(question, max_results=5)
-                
-                # Process web search results
-                for result in web_results:
-                    # Add citation
-                    cite_id = self.citation_manager.add_citation(
-                        title=result.get('title', 'Untitled'),
-                        url=result.get('url', ''),
-                        source_type='web'
-                    )
-                    
+            # Process vector DB results
+            if vector_results is not None:
+                for doc, metadata, distance in zip(
+                    vector_results.get('documents', []),
+                    vector_results.get('metadatas', []),
+                    vector_results.get('distances', [])
+                ):
+                    content = doc[:_CONTENT_CHARS]
                     evidence_sources.append({
-                        'source': 'web',
-                        'title': result.get('title', 'Untitled'),
-                        'url': result.get('url', ''),
-                        'content': result.get('content', result.get('snippet', ''))[:1000],
-                        'snippet': result.get('snippet', ''),
-                        'citation_id': cite_id,
-                        'relevance_score': 1.0  # Default relevance
+                        'source': 'vector_db',
+                        'content': content,
+                        'preview': content[:_PREVIEW_CHARS],
+                        'metadata': metadata,
+                        'relevance_score': 1.0 - distance,  # Convert distance to similarity
+                        'title': metadata.get('title', 'Knowledge Base Document')
                     })
-                
-                logger.info(f"Found {len(web_results)} web results for {rq_id}")
-            except Exception as e:
-                logger.error(f"Web search failed for {rq_id}: {e}")
             
-            # 3. Combine and rank evidence
-            # Sort by relevance score (descending)
-            evidence_sources.sort(key=lambda x: x.get('relevance_score', 0), reverse=True)
+            # Process web search results
+            for result in web_results:
+                # Add citation
+                cite_id = self.citation_manager.add_citation(
+                    title=result.get('title', 'Untitled'),
+                    url=result.get('url', ''),
+                    source_type='web'
+                )
+                
+                content = (result.get('content') or result.get('snippet', ''))[:_CONTENT_CHARS]
+                evidence_sources.append({
+                    'source': 'web',
+                    'title': result.get('title', 'Untitled'),
+                    'url': result.get('url', ''),
+                    'content': content,
+                    'preview': content[:_PREVIEW_CHARS],
+                    'snippet': result.get('snippet', ''),
+                    'citation_id': cite_id,
+                    'relevance_score': 1.0  # Default relevance
+                })
             
-            # Limit to max_sources
-            all_evidence[rq_id] = evidence_sources[:self.max_sources]
+            # Combine and rank evidence
+            # Keep the max_sources most relevant (same order as a stable
+            # descending sort, without sorting the rest)
+            all_evidence[rq_id] = heapq.nlargest(
+                self.max_sources, evidence_sources, key=_relevance
+            )
             
             logger.info(f"Total evidence for {rq_id}: {len(all_evidence[rq_id])} sources")
         
@@ -187,90 +457,59 @@ class GrounderAgent(BaseAgent):
         logger.info(f"Retrieved total of {total_sources} evidence sources across all questions")
         
         # Store evidence in state for later use
-        if not hasattr(state, 'evidence'):
-            state.evidence = {}
         state.evidence.update(all_evidence)
         
         # Build evidence sections for prompt
         evidence_sections = []
         for rq_id, sources in all_evidence.items():
             if sources:
-                evidence_text = f"\n### Evidence for {rq_id}\n\n"
+                evidence_parts = [f"\n### Evidence for {rq_id}\n\n"]
                 for idx, source in enumerate(sources, 1):
                     source_marker = f"[Source {idx}]"
-                    evidence_text += f"{source_marker} **{source.get('title', 'Untitled')}**\n"
+                    evidence_parts.append(f"{source_marker} **{source.get('title', 'Untitled')}**\n")
                     
                     if source.get('url'):
-                        evidence_text += f"URL: {source['url']}\n"
+                        evidence_parts.append(f"URL: {source['url']}\n")
                     
-                    evidence_text += f"Content: {source.get('content', source.get('snippet', 'No content available'))[:500]}...\n\n"
+                    evidence_parts.append(f"Content: {source['preview'] or 'No content available'}...\n\n")
                 
-                evidence_sections.append(evidence_text)
+                evidence_sections.append(''.join(evidence_parts))
         
         # Prepare comprehensive input JSON with all questions AND evidence
         input_json = {
             "user_brief": state.user_brief,
             "research_questions": all_research_questions,
-            "evidence_available": len(evidence_sections) > 0,
-            "instructions": """
-CRITICAL DIRECTIVE: Provide comprehensive, evidence-backed answers for each research question.
-
-For EACH research question, provide:
-1. A clear, detailed answer (3-5 paragraphs, 300-500 words per question)
-2. Technical analysis explaining key principles and mechanisms
-3. Real-world examples (2-3) with specific use cases
-4. Key findings with supporting evidence from retrieved sources
-5. Related concepts and interconnections
-6. Implementation guidance and best practices
-7. Common challenges and solutions
-8. Future trends and directions
-
-**CITATION REQUIREMENTS**:
-- Reference sources using [Source N] markers (e.g., "According to [Source 1]...")
-- Integrate evidence naturally into your narrative
-- Prioritize information from provided sources
-- Cite sources for all factual claims when available
-
-Focus on depth, accuracy, and evidence-based reasoning.
-Target: 2000-4000 words total for all questions combined.
-Every claim should be substantiated with citations or reasoning.
-"""
+            "evidence_available": len(evidence_sections) > 0
         }
         
-        # Build the full prompt
-        prompt = f"{self.prompt_template}\n\n"
-        prompt += f"## Input\n\n"
-        prompt += f"```json\n{self.prompt_engine.inject_variables('{input}', {'input': input_json})}\n```\n\n"
+        # Build the full prompt: static text first, per-run input last
+        if evidence_sections:
+            prompt_parts = [
+                f"{self.prompt_template}\n\n",
+                f"{_ANSWER_INSTRUCTIONS}\n",
+                f"{_CONTENT_REQUIREMENTS}\n"
+            ]
+        else:
+            logger.warning("No evidence retrieved - using the general-knowledge prompt")
+            prompt_parts = [
+                f"{self.prompt_template}\n\n",
+                f"{_NO_EVIDENCE_INSTRUCTIONS}\n"
+            ]
+        
+        prompt_parts.append("## Input\n\n")
+        prompt_parts.append(f"```json\n{self.prompt_engine.format_json(input_json)}\n```\n\n")
         
         # *** NEW: Include retrieved evidence ***
         if evidence_sections:
-            prompt += f"\n## Retrieved Evidence\n"
-            prompt += "\n".join(evidence_sections)
-            prompt += "\n"
+            prompt_parts.append("\n## Retrieved Evidence\n")
+            prompt_parts.append("\n".join(evidence_sections))
+            prompt_parts.append("\n")
             logger.info(f"Prompt includes {len(evidence_sections)} evidence sections with {total_sources} total sources")
-        else:
-            logger.warning("No evidence retrieved - output may lack citations")
         
-        prompt += f"""## Content Requirements
-
-**CRITICAL DIRECTIVE**: Provide comprehensive, evidence-backed answers. Each research question requires:
-- Clear explanation (3-5 paragraphs, 300-500 words)
-- Technical analysis explaining key concepts and mechanisms
-- Real-world examples (2-3) with specific use cases from sources
-- Implementation guidance: practical patterns and best practices
-- Common challenges with solutions
-- Future directions and emerging trends
-- **CITE all factual claims using [Source N] markers**
-
-TARGET: 2000-4000 words total for all questions combined.
-Focus on clarity, accuracy, and practical value.
-Every claim must be substantiated with evidence from sources or reasoning.
-Provide actionable insights that users can apply.
-
-## Your Response
-
-Provide your response as valid JSON only:"""
+        prompt_parts.append("## Your Response\n\n")
+        prompt_parts.append("Provide your response as valid JSON only:")
         
+        prompt = ''.join(prompt_parts)
         return prompt
     
     def _parse_response(
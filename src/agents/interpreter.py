@@ -7,7 +7,7 @@ from pathlib import Path
 import logging
 
 from .base_agent import BaseAgent, PromptEngine
-from ..orchestration.state import SharedState
+from ..orchestration.state import SharedState, ExecutionMode
 
 
 logger = logging.getLogger(__name__)
@@ -26,7 +26,8 @@ class InterpreterAgent(BaseAgent):
         model_name: str = "llama3.1:8b-instruct-q4_K_M",
         vram_mb: int = 5000,
         temperature: float = 0.3,
-        max_questions: int = 5
+        max_questions: int = 5,
+        cache_strategy: str = "off"
     ):
         """
         Initialize the Interpreter agent.
@@ -36,12 +37,14 @@ class InterpreterAgent(BaseAgent):
             vram_mb: Expected VRAM usage
             temperature: Sampling temperature
             max_questions: Maximum clarifying questions
+            cache_strategy: Response cache strategy ("exact" or "off")
         """
         super().__init__(
             name="Interpreter",
             model_name=model_name,
             vram_mb=vram_mb,
-            temperature=temperature
+            temperature=temperature,
+            cache_strategy=cache_strategy
         )
         
         self.max_questions = max_questions
@@ -74,7 +77,7 @@ class InterpreterAgent(BaseAgent):
         # Build the full prompt
         prompt = f"{self.prompt_template}\n\n"
         prompt += f"## Input\n\n"
-        prompt += f"```json\n{self.prompt_engine.inject_variables('{input}', {'input': input_json})}\n```\n\n"
+        prompt += f"```json\n{self.prompt_engine.format_json(input_json)}\n```\n\n"
         prompt += f"## Your Response\n\n"
         prompt += f"Provide your response as valid JSON only:"
         
@@ -129,12 +132,9 @@ class InterpreterAgent(BaseAgent):
         Returns:
             Minimal valid output
         """
-        # Handle execution_mode being either string or enum
-        mode_value = (
-            state.execution_mode.value 
-            if hasattr(state.execution_mode, 'value') 
-            else str(state.execution_mode)
-        )
+        # SharedState stores the enum's value (use_enum_values), but a
+        # later assignment may still hold the enum; ExecutionMode() takes both
+        mode_value = ExecutionMode(state.execution_mode).value
         
         return {
             "intent": {
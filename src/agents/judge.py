@@ -7,7 +7,7 @@ from pathlib import Path
 import logging
 
 from .base_agent import BaseAgent, PromptEngine
-from ..orchestration.state import SharedState
+from ..orchestration.state import SharedState, ExecutionMode
 
 
 logger = logging.getLogger(__name__)
@@ -27,7 +27,8 @@ class JudgeAgent(BaseAgent):
         vram_mb: int = 9000,
         temperature: float = 0.2,
         consensus_threshold: float = 0.85,
-        max_deliberation_rounds: int = 7
+        max_deliberation_rounds: int = 7,
+        cache_strategy: str = "off"
     ):
         """
         Initialize the Judge agent.
@@ -38,12 +39,14 @@ class JudgeAgent(BaseAgent):
             temperature: Sampling temperature
             consensus_threshold: Minimum consensus score to accept
             max_deliberation_rounds: Maximum deliberation rounds
+            cache_strategy: Response cache strategy ("exact" or "off")
         """
         super().__init__(
             name="Judge",
             model_name=model_name,
             vram_mb=vram_mb,
-            temperature=temperature
+            temperature=temperature,
+            cache_strategy=cache_strategy
         )
         
         self.consensus_threshold = consensus_threshold
@@ -77,7 +80,7 @@ class JudgeAgent(BaseAgent):
         # Build the full prompt
         prompt = f"{self.prompt_template}\n\n"
         prompt += f"## Input\n\n"
-        prompt += f"```json\n{self.prompt_engine.inject_variables('{input}', {'input': input_json})}\n```\n\n"
+        prompt += f"```json\n{self.prompt_engine.format_json(input_json)}\n```\n\n"
         prompt += f"## Your Response\n\n"
         prompt += f"Provide your response as valid JSON only:"
         
@@ -160,7 +163,7 @@ class JudgeAgent(BaseAgent):
                 "justification": "Degraded mode - unable to perform full synthesis"
             },
             "final_artifact": {
-                "type": state.execution_mode.value if hasattr(state.execution_mode, 'value') else str(state.execution_mode),
+                "type": ExecutionMode(state.execution_mode).value,
                 "sections": sections,
                 "metadata": {
                     "created_at": state.started_at.isoformat(),
@@ -26,7 +26,8 @@ class PlannerAgent(BaseAgent):
         model_name: str = "mistral-nemo:12b-instruct-q4_K_M",
         vram_mb: int = 7500,
         temperature: float = 0.5,
-        max_research_questions: int = 15
+        max_research_questions: int = 15,
+        cache_strategy: str = "off"
     ):
         """
         Initialize the Planner agent.
@@ -36,12 +37,14 @@ class PlannerAgent(BaseAgent):
             vram_mb: Expected VRAM usage
             temperature: Sampling temperature
             max_research_questions: Maximum RQs to generate
+            cache_strategy: Response cache strategy ("exact" or "off")
         """
         super().__init__(
             name="Planner",
             model_name=model_name,
             vram_mb=vram_mb,
-            temperature=temperature
+            temperature=temperature,
+            cache_strategy=cache_strategy
         )
         
         self.max_research_questions = max_research_questions
@@ -71,7 +74,7 @@ class PlannerAgent(BaseAgent):
         # Build the full prompt
         prompt = f"{self.prompt_template}\n\n"
         prompt += f"## Input\n\n"
-        prompt += f"```json\n{self.prompt_engine.inject_variables('{input}', {'input': input_json})}\n```\n\n"
+        prompt += f"```json\n{self.prompt_engine.format_json(input_json)}\n```\n\n"
         prompt += f"## Your Response\n\n"
         prompt += f"Provide your response as valid JSON only:"
         
@@ -12,6 +12,47 @@ from ..orchestration.state import SharedState
 
 logger = logging.getLogger(__name__)
 
+# Budget for the findings or plan passed to the model as content, in
+# characters of compact JSON
+_MAX_CONTENT_CHARS = 8000
+
+# Per-field string lengths tried, longest first, until the content fits
+_FIELD_CHAR_LIMITS = (2000, 500, 150)
+
+# Items kept from any list inside the findings or plan
+_MAX_LIST_ITEMS = 10
+
+
+def _trim(value: Any, field_chars: int) -> Any:
+    """Copy value with long strings shortened and long lists cut."""
+    if isinstance(value, str):
+        return value[:field_chars]
+    if isinstance(value, dict):
+        return {key: _trim(item, field_chars) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_trim(item, field_chars) for item in value[:_MAX_LIST_ITEMS]]
+    return value
+
+
+def _fit_content(value: Any) -> Any:
+    """
+    Shrink findings or plan data to fit _MAX_CONTENT_CHARS.
+    
+    Fields are trimmed rather than the serialized text, so the result is
+    still whole JSON data that gets encoded once with the prompt input.
+    
+    Args:
+        value: JSON-serializable findings or plan
+    
+    Returns:
+        Trimmed copy; the shortest trim if none fits the budget
+    """
+    for field_chars in _FIELD_CHAR_LIMITS:
+        trimmed = _trim(value, field_chars)
+        if len(PromptEngine.format_json(trimmed, indent=False)) <= _MAX_CONTENT_CHARS:
+            break
+    return trimmed
+
 
 class VisualizerAgent(BaseAgent):
     """
@@ -25,7 +66,8 @@ class VisualizerAgent(BaseAgent):
         self,
         model_name: str = "phi3.5:3.8b-mini-instruct-q4_K_M",
         vram_mb: int = 2500,
-        temperature: float = 0.5
+        temperature: float = 0.5,
+        cache_strategy: str = "off"
     ):
         """
         Initialize the Visualizer agent.
@@ -34,12 +76,14 @@ class VisualizerAgent(BaseAgent):
             model_name: Ollama model name
             vram_mb: Expected VRAM usage
             temperature: Sampling temperature
+            cache_strategy: Response cache strategy ("exact" or "off")
         """
         super().__init__(
             name="Visualizer",
             model_name=model_name,
             vram_mb=vram_mb,
-            temperature=temperature
+            temperature=temperature,
+            cache_strategy=cache_strategy
         )
         
         # Load prompt template
@@ -57,12 +101,13 @@ class VisualizerAgent(BaseAgent):
         Returns:
             Formatted prompt
         """
-        # Prepare input JSON
+        # Prepare input JSON; findings and plan are nested as data (encoded
+        # once with the rest of the input) and trimmed to the content budget
         content = ""
         if state.research_findings:
-            content = str(state.research_findings[:2])  # First 2 findings
+            content = _fit_content(state.research_findings[:2])  # First 2 findings
         elif state.plan:
-            content = str(state.plan)
+            content = _fit_content(state.plan)
         else:
             content = state.user_brief
         
@@ -74,7 +119,7 @@ class VisualizerAgent(BaseAgent):
         # Build the full prompt
         prompt = f"{self.prompt_template}\n\n"
         prompt += f"## Input\n\n"
-        prompt += f"```json\n{self.prompt_engine.inject_variables('{input}', {'input': input_json})}\n```\n\n"
+        prompt += f"```json\n{self.prompt_engine.format_json(input_json)}\n```\n\n"
         prompt += f"## Your Response\n\n"
         prompt += f"Provide your response as valid JSON only:"
         
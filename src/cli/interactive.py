@@ -3,13 +3,13 @@ Interactive mode for answering clarifying questions.
 """
 
 from typing import Dict, Any, List
-from rich.console import Console
-from rich.prompt import Prompt, Confirm
 
 
 class InteractiveMode:
     """
     Handles interactive clarifying questions.
+    
+    Rich is imported only when use_rich is set.
     """
     
     def __init__(self, use_rich: bool = True):
@@ -20,7 +20,10 @@ class InteractiveMode:
             use_rich: Whether to use Rich formatting
         """
         self.use_rich = use_rich
-        self.console = Console() if use_rich else None
+        self.console = None
+        if use_rich:
+            from rich.console import Console
+            self.console = Console()
     
     def get_brief(self) -> str:
         """
@@ -33,6 +36,7 @@ class InteractiveMode:
             print("\nWhat would you like to know or create?")
             return input("> ")
         
+        from rich.prompt import Prompt
         self.console.print("\n[bold cyan]What would you like to know or create?[/bold cyan]")
         return Prompt.ask("Brief")
     
@@ -61,6 +65,7 @@ class InteractiveMode:
                 answers[question] = answer
             return answers
         
+        from rich.prompt import Prompt
         self.console.print("\n[bold yellow]I have some clarifying questions:[/bold yellow]\n")
         
         answers = {}
@@ -89,6 +94,7 @@ class InteractiveMode:
             response = input("\nProceed? (y/n) ")
             return response.lower() in ['y', 'yes']
         
+        from rich.prompt import Confirm
         self.console.print("\n[bold]Execution Plan:[/bold]")
         self.console.print(f"  Mode: [cyan]{summary.get('mode', 'unknown')}[/cyan]")
         self.console.print(f"  Agents: [cyan]{summary.get('agents', 'unknown')}[/cyan]")
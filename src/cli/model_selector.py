@@ -2,30 +2,75 @@
 Model Selector - Interactive model selection for single-model mode.
 """
 
+import bisect
 import urllib.request
 import urllib.error
 import json
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Tuple
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of the model list
+    orjson = None
 
-def get_available_models(ollama_url: str = "http://localhost:11434") -> List[Dict[str, Any]]:
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Seconds a fetched model list is reused before Ollama is asked again
+_MODELS_CACHE_TTL = 30.0
+
+# ollama_url -> (monotonic fetch time, models)
+_models_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+
+# Quality tiers by download size: models under _QUALITY_SIZE_LIMITS_GB[i]
+# gigabytes get _QUALITY_LABELS[i]; larger models get the last label
+_QUALITY_SIZE_LIMITS_GB = (3, 6, 8)
+_QUALITY_LABELS = (
+    "⭐⭐ (Fast, Basic)",
+    "⭐⭐⭐ (Balanced)",
+    "⭐⭐⭐⭐ (High Quality)",
+    "⭐⭐⭐⭐⭐ (Best Quality)",
+)
+
+
+def get_available_models(
+    ollama_url: str = "http://localhost:11434",
+    force_refresh: bool = False
+) -> List[Dict[str, Any]]:
     """
     Fetch available models from Ollama.
     
+    The list is cached per URL for _MODELS_CACHE_TTL seconds; failed or
+    empty fetches are not cached.
+    
     Args:
         ollama_url: Ollama base URL
+        force_refresh: Bypass the cache and query Ollama
     
     Returns:
         List of model dictionaries
     """
+    cached = _models_cache.get(ollama_url)
+    if (
+        not force_refresh
+        and cached is not None
+        and time.monotonic() - cached[0] < _MODELS_CACHE_TTL
+    ):
+        return cached[1]
+    
     try:
         req = urllib.request.Request(f"{ollama_url}/api/tags", method='GET')
         with urllib.request.urlopen(req, timeout=5) as response:
-            data = json.loads(response.read())
-            return data.get('models', [])
+            data = _json_loads(response.read())
+            models = data.get('models', [])
     except Exception as e:
         print(f"Error fetching models: {e}")
         return []
+    
+    if models:
+        _models_cache[ollama_url] = (time.monotonic(), models)
+    return models
 
 
 def format_model_size(size_bytes: int) -> str:
@@ -42,10 +87,26 @@ def format_model_size(size_bytes: int) -> str:
     return f"{gb:.1f} GB"
 
 
+def sort_models_by_size(models: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Order models smallest first, as the selection menu numbers them.
+    
+    Args:
+        models: List of available models
+    
+    Returns:
+        New list sorted by size
+    """
+    return sorted(models, key=lambda m: m.get('size', 0))
+
+
 def display_model_menu(models: List[Dict[str, Any]]) -> None:
     """
     Display interactive model selection menu.
     
+    Models are numbered in size order; select by indexing the list
+    returned by sort_models_by_size.
+    
     Args:
         models: List of available models
     """
@@ -55,24 +116,14 @@ def display_model_menu(models: List[Dict[str, Any]]) -> None:
     print("\nAvailable models:")
     print()
     
-    # Filter and sort models by size
-    sorted_models = sorted(models, key=lambda m: m.get('size', 0))
-    
-    for idx, model in enumerate(sorted_models, 1):
+    for idx, model in enumerate(sort_models_by_size(models), 1):
         name = model.get('name', 'unknown')
         size = format_model_size(model.get('size', 0))
         
         # Add quality indicator based on size
         if 'size' in model:
             size_gb = model['size'] / (1024 ** 3)
-            if size_gb < 3:
-                quality = "⭐⭐ (Fast, Basic)"
-            elif size_gb < 6:
-                quality = "⭐⭐⭐ (Balanced)"
-            elif size_gb < 8:
-                quality = "⭐⭐⭐⭐ (High Quality)"
-            else:
-                quality = "⭐⭐⭐⭐⭐ (Best Quality)"
+            quality = _QUALITY_LABELS[bisect.bisect_right(_QUALITY_SIZE_LIMITS_GB, size_gb)]
         else:
             quality = ""
         
@@ -93,7 +144,8 @@ def select_model_interactive(ollama_url: str = "http://localhost:11434") -> Opti
     Returns:
         Selected model name or None if cancelled
     """
-    models = get_available_models(ollama_url)
+    # Keep the menu's numbering so a selection maps to the model shown
+    models = sort_models_by_size(get_available_models(ollama_url))
     
     if not models:
         print("\n[!] No models found in Ollama.")
@@ -110,12 +162,20 @@ def select_model_interactive(ollama_url: str = "http://localhost:11434") -> Opti
     # Get user selection
     while True:
         try:
-            selection = input("Enter model number (or 'q' to quit): ").strip()
+            selection = input("Enter model number ('r' to refresh, 'q' to quit): ").strip()
             
             if selection.lower() == 'q':
                 print("Cancelled.")
                 return None
             
+            if selection.lower() == 'r':
+                # Pick up models pulled since the list was fetched
+                models = sort_models_by_size(
+                    get_available_models(ollama_url, force_refresh=True)
+                ) or models
+                display_model_menu(models)
+                continue
+            
             idx = int(selection)
             
             if 1 <= idx <= len(models):
@@ -100,6 +100,12 @@ def create_parser() -> argparse.ArgumentParser:
         help="Validate configuration and exit without execution"
     )
     
+    parser.add_argument(
+        "--skip-preflight",
+        action="store_true",
+        help="Skip the Ollama pre-flight connectivity check"
+    )
+    
     parser.add_argument(
         "--single-model",
         action="store_true",
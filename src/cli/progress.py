@@ -2,12 +2,6 @@
 Progress indicators and Rich UI components.
 """
 
-from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.panel import Panel
-from rich.table import Table
-from rich.syntax import Syntax
-from rich.markdown import Markdown
 from typing import Optional, Dict, Any
 import json
 
@@ -15,6 +9,9 @@ import json
 class ProgressUI:
     """
     Rich UI components for progress visualization.
+    
+    Rich is imported only when use_rich is set, so plain-text runs
+    (--no-rich) never load it.
     """
     
     def __init__(self, use_rich: bool = True):
@@ -25,7 +22,10 @@ class ProgressUI:
             use_rich: Whether to use Rich formatting
         """
         self.use_rich = use_rich
-        self.console = Console() if use_rich else None
+        self.console = None
+        if use_rich:
+            from rich.console import Console
+            self.console = Console()
     
     def show_banner(self):
         """Display the ZenKnowledgeForge banner."""
@@ -42,6 +42,7 @@ class ProgressUI:
         ==============================================================
         """
         
+        from rich.panel import Panel
         self.console.print(Panel(banner, style="bold blue"))
     
     def show_config_summary(self, config_info: Dict[str, Any]):
@@ -58,6 +59,7 @@ class ProgressUI:
             print()
             return
         
+        from rich.table import Table
         table = Table(title="Configuration", show_header=True)
         table.add_column("Setting", style="cyan")
         table.add_column("Value", style="green")
@@ -154,6 +156,7 @@ class ProgressUI:
                 print(f"\nSaved to: {output_file}")
             return
         
+        from rich.panel import Panel
         self.console.print("\n")
         self.console.print(Panel(
             "[bold green][OK] Artifact Generated Successfully[/bold green]",
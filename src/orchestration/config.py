@@ -3,12 +3,16 @@ Configuration loader and validation using Pydantic models.
 """
 
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Literal, Optional, Any
 import yaml
 from pydantic import BaseModel, Field, field_validator
 import os
 from dotenv import load_dotenv
 
+# Prefer libyaml's C loader; fall back to the pure-Python loader when PyYAML
+# was built without it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class AgentConfig(BaseModel):
     """Configuration for a single agent."""
@@ -22,6 +26,7 @@ class AgentConfig(BaseModel):
     max_sources: Optional[int] = None
     consensus_threshold: Optional[float] = None
     max_deliberation_rounds: Optional[int] = None
+    cache_strategy: Literal["off", "exact"] = "off"
 
 
 class PipelineStep(BaseModel):
@@ -114,6 +119,7 @@ class ConfigLoader:
         
         self._agents_config: Optional[AgentsYamlConfig] = None
         self._hardware_config: Optional[HardwareYamlConfig] = None
+        self._hardware_validated = False
     
     def load_agents_config(self) -> AgentsYamlConfig:
         """Load and validate agents.yaml configuration."""
@@ -121,11 +127,11 @@ class ConfigLoader:
             return self._agents_config
         
         agents_file = self.config_dir / "agents.yaml"
-        if not agents_file.exists():
-            raise FileNotFoundError(f"agents.yaml not found at {agents_file}")
-        
-        with open(agents_file, 'r') as f:
-            data = yaml.safe_load(f)
+        try:
+            with open(agents_file, 'r') as f:
+                data = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"agents.yaml not found at {agents_file}") from None
         
         self._agents_config = AgentsYamlConfig(**data)
         return self._agents_config
@@ -136,11 +142,11 @@ class ConfigLoader:
             return self._hardware_config
         
         hardware_file = self.config_dir / "hardware.yaml"
-        if not hardware_file.exists():
-            raise FileNotFoundError(f"hardware.yaml not found at {hardware_file}")
-        
-        with open(hardware_file, 'r') as f:
-            data = yaml.safe_load(f)
+        try:
+            with open(hardware_file, 'r') as f:
+                data = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"hardware.yaml not found at {hardware_file}") from None
         
         self._hardware_config = HardwareYamlConfig(**data)
         return self._hardware_config
@@ -152,6 +158,10 @@ class ConfigLoader:
         Returns:
             True if compatible, raises ValueError otherwise
         """
+        # Both configs are memoized, so a passing result cannot change
+        if self._hardware_validated:
+            return True
+        
         hw_config = self.load_hardware_config()
         agents_config = self.load_agents_config()
         
@@ -169,6 +179,7 @@ class ConfigLoader:
                 f"Minimum required: {min(a.vram_mb for a in agents_config.agents.values())}MB"
             )
         
+        self._hardware_validated = True
         return True
     
     def get_ollama_base_url(self) -> str:
@@ -224,8 +235,8 @@ class ConfigLoader:
             Prompt template as string
         """
         prompt_file = self.config_dir / "prompts" / f"{agent_name}.md"
-        if not prompt_file.exists():
-            raise FileNotFoundError(f"Prompt template not found: {prompt_file}")
-        
-        with open(prompt_file, 'r') as f:
-            return f.read()
+        try:
+            with open(prompt_file, 'r') as f:
+                return f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Prompt template not found: {prompt_file}") from None
@@ -3,7 +3,9 @@ Pipeline Engine - Main execution loop for agent orchestration.
 """
 
 import logging
-from typing import Dict, Any, Optional, List, Callable
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Callable, Tuple
 from pathlib import Path
 import uuid
 from datetime import datetime
@@ -16,6 +18,10 @@ from .progress_tracker import ProgressTracker
 
 logger = logging.getLogger(__name__)
 
+# Agents that only read upstream state (intent/plan/findings) and write a
+# field no sibling reads, so adjacent ones can run concurrently.
+_INDEPENDENT_AGENTS = frozenset({"auditor", "visualizer"})
+
 
 class PipelineEngine:
     """
@@ -136,52 +142,60 @@ class PipelineEngine:
             agent_names=agent_names
         )
         
-        # Execute each agent in sequence
-        for agent_name in agent_names:
-            try:
+        # Execute each stage; independent agents in a stage run concurrently
+        for stage in self._group_pipeline_steps(agent_names):
+            for position, agent_name in enumerate(stage):
                 logger.info(f"Executing agent: {agent_name}")
                 
                 # Start progress tracking
-                progress_tracker.start_agent(agent_name)
-                
-                # Get agent instance
-                if agent_name not in self._agent_registry:
-                    raise ValueError(f"Agent not registered: {agent_name}")
-                
-                agent = self._agent_registry[agent_name]
-                
-                # Update status
-                progress_tracker.update_status("Thinking...")
-                
-                # Execute agent
-                agent_output = agent.think(state, self.model_manager)
-                
-                # Validate output quality
-                if not self._validate_agent_output(agent_name, agent_output):
-                    logger.warning(
-                        f"Agent {agent_name} produced low-quality output, "
-                        f"but continuing pipeline"
-                    )
-                
-                # Update state with agent output
-                state.add_agent_output(agent_name, agent_output)
-                
-                # Agent-specific state updates
-                self._update_state_from_agent(state, agent_name, agent_output)
-                
-                logger.info(f"Agent {agent_name} completed successfully")
-                
-                # Complete progress tracking
-                progress_tracker.complete_agent(agent_name)
-                
-            except Exception as e:
-                error_msg = f"Error in agent {agent_name}: {str(e)}"
-                logger.error(error_msg, exc_info=True)
-                state.add_error(agent_name, error_msg)
-                
-                # Decide whether to continue or abort
-                # For now, we'll continue with other agents
-                continue
+                progress_tracker.start_agent(agent_name, alongside=position > 0)
+            
+            # Update status
+            progress_tracker.update_status("Thinking...")
+            
+            # Execute agent(s)
+            if len(stage) == 1:
+                results = [self._timed_think(stage[0], state)]
+            else:
+                logger.info(f"Running concurrently: {', '.join(stage)}")
+                with ThreadPoolExecutor(max_workers=len(stage)) as pool:
+                    results = list(pool.map(
+                        lambda agent_name: self._timed_think(agent_name, state),
+                        stage
+                    ))
+            
+            # Apply outputs in pipeline order so state updates stay deterministic
+            for agent_name, (agent_output, finished_at) in zip(stage, results):
+                try:
+                    if isinstance(agent_output, Exception):
+                        raise agent_output
+                    
+                    # Validate output quality
+                    if not self._validate_agent_output(agent_name, agent_output):
+                        logger.warning(
+                            f"Agent {agent_name} produced low-quality output, "
+                            f"but continuing pipeline"
+                        )
+                    
+                    # Update state with agent output
+                    state.add_agent_output(agent_name, agent_output)
+                    
+                    # Agent-specific state updates
+                    self._update_state_from_agent(state, agent_name, agent_output)
+                    
+                    logger.info(f"Agent {agent_name} completed successfully")
+                    
+                    # Complete progress tracking
+                    progress_tracker.complete_agent(agent_name, finished_at)
+                    
+                except Exception as e:
+                    error_msg = f"Error in agent {agent_name}: {str(e)}"
+                    logger.error(error_msg, exc_info=True)
+                    state.add_error(agent_name, error_msg)
+                    
+                    # Decide whether to continue or abort
+                    # For now, we'll continue with other agents
+                    continue
         
         # Mark completion
         state.completed_at = datetime.now()
@@ -203,6 +217,73 @@ class PipelineEngine:
         # Return final state
         return state
     
+    def _get_agent(self, agent_name: str) -> Any:
+        """
+        Look up a registered agent.
+        
+        Args:
+            agent_name: Name of the agent
+        
+        Returns:
+            Agent instance
+        
+        Raises:
+            ValueError: If the agent is not registered
+        """
+        if agent_name not in self._agent_registry:
+            raise ValueError(f"Agent not registered: {agent_name}")
+        
+        return self._agent_registry[agent_name]
+    
+    def _group_pipeline_steps(self, agent_names: List[str]) -> List[List[str]]:
+        """
+        Group pipeline steps into stages that can run together.
+        
+        Adjacent independent agents share a stage only when they resolve to
+        the same model: with one model in VRAM at a time, agents on different
+        models would swap it out from under each other.
+        
+        Args:
+            agent_names: Agent names in execution order
+        
+        Returns:
+            List of stages, each a list of agent names
+        """
+        stages: List[List[str]] = []
+        stage_model: Optional[str] = None
+        
+        for agent_name in agent_names:
+            agent = self._agent_registry.get(agent_name)
+            model = None
+            if agent is not None and agent_name in _INDEPENDENT_AGENTS:
+                model, _ = self.model_manager.resolve_model(agent.model_name, agent.vram_mb)
+            
+            if model is not None and model == stage_model:
+                stages[-1].append(agent_name)
+            else:
+                stages.append([agent_name])
+                stage_model = model
+        
+        return stages
+    
+    def _timed_think(self, agent_name: str, state: SharedState) -> Tuple[Any, float]:
+        """
+        Run one agent against the current state.
+        
+        Args:
+            agent_name: Name of the agent
+            state: Current shared state (read-only while a stage runs)
+        
+        Returns:
+            Tuple of (agent output or the exception it raised, finish time)
+        """
+        try:
+            agent_output = self._get_agent(agent_name).think(state, self.model_manager)
+        except Exception as e:
+            agent_output = e
+        
+        return agent_output, time.time()
+    
     def _update_state_from_agent(
         self,
         state: SharedState,
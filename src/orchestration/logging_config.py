@@ -6,8 +6,6 @@ import logging
 import sys
 from pathlib import Path
 from typing import Optional
-from rich.logging import RichHandler
-from rich.console import Console
 
 
 def setup_logging(
@@ -36,8 +34,12 @@ def setup_logging(
     # Remove existing handlers
     root_logger.handlers.clear()
     
-    # Console handler with Rich formatting
+    # Console handler with Rich formatting; Rich is only imported here so
+    # plain-text runs never load it
     if rich_formatting:
+        from rich.logging import RichHandler
+        from rich.console import Console
+        
         # Use UTF-8 encoding for console on Windows
         console = Console(stderr=True, force_terminal=True)
         console_handler = RichHandler(
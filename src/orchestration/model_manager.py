@@ -7,18 +7,27 @@ hardware constraints (6GB VRAM limit on RTX 3050).
 Supports SINGLE_MODEL mode to avoid model swapping entirely.
 """
 
+import json
 import os
 import threading
 import time
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, Tuple
 import httpx
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of streamed chunks
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
+# Ollama streams one small JSON object per generated token
+_json_loads = orjson.loads if orjson is not None else json.loads
+
 
 @dataclass
 class ModelInfo:
@@ -84,7 +93,13 @@ class ModelManager:
         # Enforce OLLAMA_KEEP_ALIVE=0
         os.environ['OLLAMA_KEEP_ALIVE'] = '0'
         
-        self._client = httpx.Client(timeout=httpx.Timeout(300.0))
+        # One pooled client for every request. Keep idle connections for a
+        # minute so model swaps and retries between long generations reuse
+        # them, and allow a few for concurrent pipeline stages.
+        self._client = httpx.Client(
+            timeout=httpx.Timeout(300.0),
+            limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=60.0)
+        )
         
         logger.info("ModelManager initialized with max_concurrent_models=1")
     
@@ -164,7 +179,8 @@ class ModelManager:
         self,
         model_name: str,
         vram_mb: int,
-        agent_name: str
+        agent_name: str,
+        announce: bool = True
     ) -> bool:
         """
         Load a model, unloading any existing model first.
@@ -173,6 +189,8 @@ class ModelManager:
             model_name: Name of the model to load (e.g., 'llama3.1:8b-instruct-q4_K_M')
             vram_mb: Expected VRAM usage in MB
             agent_name: Name of the agent requesting the model
+            announce: Print the step-by-step progress to stdout; pass False
+                from background threads, which only go through the logger
         
         Returns:
             True if successful
@@ -181,6 +199,8 @@ class ModelManager:
             TimeoutError: If model swap takes too long
             RuntimeError: If model loading fails after retries
         """
+        say = print if announce else (lambda message: None)
+        
         with self._lock:
             # If the same model is already loaded, we're done
             if (
@@ -199,22 +219,22 @@ class ModelManager:
                     logger.warning("Failed to cleanly unload previous model")
                 
                 # Give Ollama time to free VRAM
-                print("   [*] Step 1/3: Freeing VRAM...")
+                say("   [*] Step 1/3: Freeing VRAM...")
                 time.sleep(2)
-                print("   [OK] VRAM freed")
+                say("   [OK] VRAM freed")
             
             # Load the new model
             logger.info(f"Loading model: {model_name} for agent: {agent_name}")
-            print(f"\n[>>] Loading Model: {model_name}")
-            print(f"   Agent: {agent_name}")
+            say(f"\n[>>] Loading Model: {model_name}")
+            say(f"   Agent: {agent_name}")
             
             for attempt in range(self.max_retries):
                 try:
-                    print(f"   [*] Step 2/3: Allocating resources (attempt {attempt + 1})...")
+                    say(f"   [*] Step 2/3: Allocating resources (attempt {attempt + 1})...")
                     start_time = time.time()
                     
                     # Make a test request to load the model
-                    print("   [*] Step 3/3: Initializing model...")
+                    say("   [*] Step 3/3: Initializing model...")
                     response = self._client.post(
                         f"{self.ollama_base_url}/api/generate",
                         json={
@@ -235,7 +255,7 @@ class ModelManager:
                             loaded_at=datetime.now(),
                             agent_name=agent_name
                         )
-                        print(f"   [OK] Model loaded successfully in {elapsed:.1f}s!")
+                        say(f"   [OK] Model loaded successfully in {elapsed:.1f}s!")
                         logger.info(
                             f"Model {model_name} loaded successfully "
                             f"in {elapsed:.1f}s (attempt {attempt + 1})"
@@ -283,6 +303,21 @@ class ModelManager:
                 f"  3. Can you access {self.ollama_base_url}?"
             )
     
+    def resolve_model(self, model_name: str, vram_mb: int) -> Tuple[str, int]:
+        """
+        Resolve the model that will actually serve a request.
+        
+        Args:
+            model_name: Name of the model requested by the agent
+            vram_mb: Expected VRAM usage of the requested model
+        
+        Returns:
+            Tuple of (model name, VRAM in MB), honouring SINGLE_MODEL mode
+        """
+        if self.single_model:
+            return self.single_model, self.single_model_vram
+        return model_name, vram_mb
+    
     def generate(
         self,
         model_name: str,
@@ -307,16 +342,11 @@ class ModelManager:
             Generated text
         """
         # SINGLE_MODEL mode: override the requested model
-        if self.single_model:
-            effective_model = self.single_model
-            effective_vram = self.single_model_vram
-            if model_name != effective_model:
-                logger.debug(
-                    f"SINGLE_MODEL mode: Using {effective_model} instead of {model_name}"
-                )
-        else:
-            effective_model = model_name
-            effective_vram = vram_mb
+        effective_model, effective_vram = self.resolve_model(model_name, vram_mb)
+        if effective_model != model_name:
+            logger.debug(
+                f"SINGLE_MODEL mode: Using {effective_model} instead of {model_name}"
+            )
         
         # Ensure model is loaded
         self.load_model(effective_model, effective_vram, agent_name)
@@ -324,23 +354,9 @@ class ModelManager:
         logger.debug(f"Generating with model {effective_model}")
         
         try:
-            # Realistic tokens for quality responses
-            # Balance depth with feasibility for 7B-14B models
-            effective_max_tokens = max_tokens if max_tokens else 4096
-            
-            request_data = {
-                "model": effective_model,
-                "prompt": prompt,
-                "stream": False,
-                "options": {
-                    "temperature": temperature,
-                    "num_predict": min(effective_max_tokens, 4096),  # Cap at 4K for reliability
-                    "num_ctx": 16384,  # Balanced context window
-                    "repeat_penalty": 1.15,  # Stronger penalty against repetition
-                    "top_k": 40,  # Diverse vocabulary selection
-                    "top_p": 0.95,  # Nucleus sampling for quality
-                }
-            }
+            request_data = self._generation_request(
+                effective_model, prompt, temperature, max_tokens, stream=False
+            )
             
             # Use longer timeout for detailed generation (30 min)
             response = self._client.post(
@@ -358,6 +374,99 @@ class ModelManager:
             logger.error(f"Error generating with model {effective_model}: {e}")
             raise
     
+    def generate_stream(
+        self,
+        model_name: str,
+        prompt: str,
+        vram_mb: int,
+        agent_name: str,
+        temperature: float = 0.3,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Generate text with a model, yielding response chunks as they arrive.
+        
+        Closing the generator early closes the HTTP stream, which makes
+        Ollama stop generating.
+        
+        Args:
+            model_name: Name of the model (may be overridden by SINGLE_MODEL)
+            prompt: Prompt to send to the model
+            vram_mb: Expected VRAM usage
+            agent_name: Name of the requesting agent
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens to generate
+        
+        Yields:
+            Generated text chunks
+        """
+        effective_model, effective_vram = self.resolve_model(model_name, vram_mb)
+        
+        # Ensure model is loaded
+        self.load_model(effective_model, effective_vram, agent_name)
+        
+        logger.debug(f"Streaming with model {effective_model}")
+        
+        request_data = self._generation_request(
+            effective_model, prompt, temperature, max_tokens, stream=True
+        )
+        
+        try:
+            with self._client.stream(
+                "POST",
+                f"{self.ollama_base_url}/api/generate",
+                json=request_data,
+                timeout=httpx.Timeout(1800.0)
+            ) as response:
+                response.raise_for_status()
+                
+                # Ollama streams one JSON object per line
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    
+                    chunk = _json_loads(line)
+                    if "error" in chunk:
+                        raise RuntimeError(chunk["error"])
+                    
+                    text = chunk.get("response")
+                    if text:
+                        yield text
+                    
+                    if chunk.get("done"):
+                        break
+                        
+        except Exception as e:
+            logger.error(f"Error streaming with model {effective_model}: {e}")
+            raise
+    
+    def _generation_request(
+        self,
+        model_name: str,
+        prompt: str,
+        temperature: float,
+        max_tokens: Optional[int],
+        stream: bool
+    ) -> Dict[str, Any]:
+        """Build the /api/generate payload shared by generate() and generate_stream()."""
+        # Realistic tokens for quality responses
+        # Balance depth with feasibility for 7B-14B models
+        effective_max_tokens = max_tokens if max_tokens else 4096
+        
+        return {
+            "model": model_name,
+            "prompt": prompt,
+            "stream": stream,
+            "options": {
+                "temperature": temperature,
+                "num_predict": min(effective_max_tokens, 4096),  # Cap at 4K for reliability
+                "num_ctx": 16384,  # Balanced context window
+                "repeat_penalty": 1.15,  # Stronger penalty against repetition
+                "top_k": 40,  # Diverse vocabulary selection
+                "top_p": 0.95,  # Nucleus sampling for quality
+            }
+        }
+    
     def cleanup(self):
         """Cleanup resources and unload models."""
         logger.info("Cleaning up ModelManager")
@@ -29,14 +29,23 @@ class ProgressTracker:
         # Track timing for each agent
         self.agent_timings = []
         self.current_agent_name = None
+        self._agent_start_times = {}
     
-    def start_agent(self, agent_name: str):
-        """Mark agent start"""
+    def start_agent(self, agent_name: str, alongside: bool = False):
+        """
+        Mark agent start
+        
+        Args:
+            agent_name: Agent being started
+            alongside: Agent runs concurrently with the one started before it,
+                so the progress position stays at the first agent of the stage
+        """
         self.current_agent_name = agent_name
         self.agent_start_time = time.time()
+        self._agent_start_times[agent_name] = self.agent_start_time
         
         # Find index
-        if agent_name in self.agent_names:
+        if agent_name in self.agent_names and not alongside:
             self.current_agent_index = self.agent_names.index(agent_name)
         
         self._print_progress("Starting")
@@ -45,10 +54,17 @@ class ProgressTracker:
         """Update current agent status"""
         self._print_progress(status)
     
-    def complete_agent(self, agent_name: str):
-        """Mark agent completion"""
-        if self.agent_start_time:
-            duration = time.time() - self.agent_start_time
+    def complete_agent(self, agent_name: str, finished_at: Optional[float] = None):
+        """
+        Mark agent completion
+        
+        Args:
+            agent_name: Agent that finished
+            finished_at: When it finished (time.time()); defaults to now
+        """
+        start_time = self._agent_start_times.pop(agent_name, self.agent_start_time)
+        if start_time:
+            duration = (finished_at or time.time()) - start_time
             
             self.agent_timings.append({
                 'agent': agent_name,
@@ -138,27 +138,52 @@ class VectorStore:
         """
         logger.debug(f"Searching for: {query} (limit={n_results})")
         
-        # Generate query embedding
-        query_embedding = self.encoder.encode([query])[0].tolist()
+        flattened = self.search_batch([query], n_results=n_results, where=where)[0]
+        
+        logger.debug(f"Found {len(flattened['ids'])} results")
+        
+        return flattened
+    
+    def search_batch(
+        self,
+        queries: List[str],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Semantic search for several queries in one round trip.
+        
+        The queries are embedded in one encoder call and sent to ChromaDB
+        as a single query, so the per-call overhead is paid once.
+        
+        Args:
+            queries: Search queries
+            n_results: Number of results to return per query
+            where: Optional metadata filter
+        
+        Returns:
+            One dictionary per query, in order, with keys: ids, documents,
+            metadatas, distances
+        """
+        if not queries:
+            return []
+        
+        logger.debug(f"Searching for {len(queries)} queries (limit={n_results})")
+        
+        query_embeddings = self.encoder.encode(queries).tolist()
         
-        # Search ChromaDB
         results = self.collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=n_results,
             where=where
         )
         
-        # Flatten nested lists (ChromaDB returns lists of lists)
-        flattened = {
-            'ids': results['ids'][0] if results['ids'] else [],
-            'documents': results['documents'][0] if results['documents'] else [],
-            'metadatas': results['metadatas'][0] if results['metadatas'] else [],
-            'distances': results['distances'][0] if results['distances'] else []
-        }
-        
-        logger.debug(f"Found {len(flattened['ids'])} results")
-        
-        return flattened
+        # ChromaDB returns one inner list per query
+        keys = ('ids', 'documents', 'metadatas', 'distances')
+        return [
+            {key: results[key][i] if results[key] else [] for key in keys}
+            for i in range(len(queries))
+        ]
     
     def get_by_id(self, ids: List[str]) -> Dict[str, Any]:
         """
@@ -2,12 +2,15 @@
 Unit tests for agents - JSON parsing and graceful degradation.
 """
 
+import json
+import os
 import pytest
 from unittest.mock import Mock, patch
 
 from src.agents.base_agent import BaseAgent, PromptEngine
 from src.agents.interpreter import InterpreterAgent
 from src.agents.planner import PlannerAgent
+from src.agents.visualizer import VisualizerAgent
 from src.orchestration.state import SharedState, ExecutionMode
 
 
@@ -30,7 +33,46 @@ class TestPromptEngine:
         result = PromptEngine.inject_variables(template, variables)
         assert "key" in result
         assert "value" in result
-    
+
+    def test_variable_injection_single_pass(self):
+        """Test that a substituted value is not scanned for placeholders."""
+        template = "{a} and {b}"
+        variables = {"a": "literal {b}", "b": "B"}
+
+        result = PromptEngine.inject_variables(template, variables)
+        assert result == "literal {b} and B"
+
+    def test_variable_injection_repeated_placeholder(self):
+        """Test that every occurrence of a placeholder is replaced."""
+        template = "{name}, {name}!"
+
+        result = PromptEngine.inject_variables(template, {"name": "Bob"})
+        assert result == "Bob, Bob!"
+
+    def test_variable_injection_unknown_placeholder(self):
+        """Test that placeholders without a value are left as-is."""
+        template = "Hello {name}, {missing}"
+
+        result = PromptEngine.inject_variables(template, {"name": "Alice"})
+        assert result == "Hello Alice, {missing}"
+
+    def test_variable_injection_non_identifier_key(self):
+        """Test that only {identifier} placeholders are substituted."""
+        template = "{a-b} {a}"
+
+        result = PromptEngine.inject_variables(template, {"a-b": "X", "a": "Y"})
+        assert result == "{a-b} Y"
+
+    def test_format_json(self):
+        """Test serializing prompt input as indented JSON."""
+        result = PromptEngine.format_json({"name": "test", "items": [1]})
+        assert result == '{\n  "name": "test",\n  "items": [\n    1\n  ]\n}'
+
+    def test_format_json_compact(self):
+        """Test serializing as single-line JSON without escaping non-ASCII."""
+        result = PromptEngine.format_json({"name": "café", "items": [1, None]}, indent=False)
+        assert result == '{"name":"café","items":[1,null]}'
+
     def test_extract_json_from_markdown(self):
         """Test extracting JSON from markdown code blocks."""
         response = '''
@@ -65,6 +107,49 @@ class TestPromptEngine:
         assert result is not None
         assert result["name"] == "test"
     
+    def test_extract_json_with_trailing_braces(self):
+        """Test that braces after the object (or inside strings) are ignored."""
+        response = '{"name": "a {nested} value", "value": 123} See also {note}.'
+
+        result = PromptEngine.extract_json_from_response(response)
+        assert result is not None
+        assert result["name"] == "a {nested} value"
+
+    def test_extract_json_after_prose_braces(self):
+        """Test that braces in prose before the object are skipped."""
+        response = 'Use {name} placeholders like this: {"name": "test", "value": 1}'
+
+        result = PromptEngine.extract_json_from_response(response)
+        assert result == {"name": "test", "value": 1}
+
+    def test_extract_json_unescaped_inner_quotes(self):
+        """Test repairing unescaped quotes inside string values."""
+        response = '{"content": "text with "quotes" inside", "value": 1,}'
+
+        result = PromptEngine.extract_json_from_response(response)
+        assert result == {"content": 'text with "quotes" inside', "value": 1}
+
+    def test_extract_json_truncated_keeps_complete_members(self):
+        """Test that a cut-off object keeps only its finished members."""
+        response = '{"name": "test", "value": 123, "summary": "long text cut o'
+
+        result = PromptEngine.extract_json_from_response(response)
+        assert result == {"name": "test", "value": 123}
+
+    def test_extract_json_truncated_drops_half_filled_object(self):
+        """Test that a nested object being written at the cut is dropped."""
+        response = '{"name": "test", "intent": {"primary_goal": "x", "domain": "te'
+
+        result = PromptEngine.extract_json_from_response(response)
+        assert result == {"name": "test"}
+
+    def test_extract_json_malformed_not_partial(self):
+        """Test that the partial fallback only tolerates end-of-input."""
+        response = '{"name": "test", bad, "value": 1'
+
+        result = PromptEngine.extract_json_from_response(response)
+        assert result is None
+
     def test_extract_json_invalid(self):
         """Test that invalid JSON returns None."""
         response = "This is not JSON at all"
@@ -128,7 +213,48 @@ class TestInterpreterAgent:
         assert result is not None
         assert "intent" in result
         assert result["intent"]["primary_goal"] == "Test goal"
-    
+
+    def test_parse_truncated_response(self):
+        """Test that truncation inside a required field still fails validation."""
+        agent = InterpreterAgent()
+
+        state = SharedState(
+            user_brief="Test",
+            execution_mode=ExecutionMode.RESEARCH
+        )
+
+        complete = '{"intent": {"primary_goal": "Test goal"}, "extracted_requirements": ["Req 1"], "ambiguities": ["Unclear sc'
+        cut_in_required = '{"intent": {"primary_goal": "Test goal"}, "extracted_requirements": ["Req'
+
+        assert agent._parse_response(complete, state)["extracted_requirements"] == ["Req 1"]
+        assert agent._parse_response(cut_in_required, state) is None
+
+    def test_think_stops_stream_at_complete_json(self):
+        """Test that streaming stops once a valid JSON object has closed."""
+        agent = InterpreterAgent()
+
+        state = SharedState(
+            user_brief="Test",
+            execution_mode=ExecutionMode.RESEARCH
+        )
+
+        chunks = ['{"intent": {"primary_goal": "Test {goal}"}, ',
+                  '"extracted_requirements": []}', ' trailing', ' text']
+        consumed = []
+
+        def fake_stream(**kwargs):
+            for chunk in chunks:
+                consumed.append(chunk)
+                yield chunk
+
+        model_manager = Mock()
+        model_manager.generate_stream.side_effect = fake_stream
+
+        result = agent.think(state, model_manager)
+
+        assert result["intent"]["primary_goal"] == "Test {goal}"
+        assert consumed == chunks[:2]
+
     def test_graceful_degradation(self):
         """Test graceful degradation when parsing fails."""
         agent = InterpreterAgent()
@@ -144,6 +270,20 @@ class TestInterpreterAgent:
         assert fallback["degraded"] == True
         assert "confidence" in fallback
 
+    def test_graceful_degradation_mode_after_assignment(self):
+        """Test that an enum assigned after construction still yields its value."""
+        agent = InterpreterAgent()
+
+        state = SharedState(
+            user_brief="Test brief",
+            execution_mode=ExecutionMode.RESEARCH
+        )
+        state.execution_mode = ExecutionMode.LEARN
+
+        fallback = agent._graceful_degradation(state)
+
+        assert fallback["intent"]["output_type"] == "learn"
+
 
 class TestPlannerAgent:
     """Test the Planner agent."""
@@ -198,6 +338,49 @@ class TestPlannerAgent:
         assert "phases" in result
 
 
+class TestVisualizerAgent:
+    """Test the Visualizer agent."""
+
+    @staticmethod
+    def prompt_input(prompt):
+        """Decode the ```json input block of a prompt."""
+        block = prompt.split("## Input\n\n```json\n", 1)[1].split("\n```", 1)[0]
+        return json.loads(block)
+
+    def test_prepare_prompt_findings_as_json(self):
+        """Test that findings are nested as data, not an escaped JSON string."""
+        agent = VisualizerAgent()
+
+        state = SharedState(
+            user_brief="Test",
+            execution_mode=ExecutionMode.RESEARCH,
+            research_findings=[{"answer": "x" * 20000, "verified": True}]
+        )
+
+        prompt = agent._prepare_prompt(state)
+        content = self.prompt_input(prompt)["content"]
+
+        assert '\\"' not in prompt
+        assert content[0]["verified"] is True
+        assert 0 < len(content[0]["answer"]) < 9000
+
+    def test_prepare_prompt_plan_fits_budget(self):
+        """Test that a large plan is trimmed field by field to the content budget."""
+        agent = VisualizerAgent()
+
+        questions = [{"id": f"RQ{i}", "question": "q" * 1000} for i in range(15)]
+        state = SharedState(
+            user_brief="Test",
+            execution_mode=ExecutionMode.RESEARCH,
+            plan={"research_questions": questions}
+        )
+
+        content = self.prompt_input(agent._prepare_prompt(state))["content"]
+
+        assert len(json.dumps(content, separators=(",", ":"))) <= 8000
+        assert content["research_questions"][0]["id"] == "RQ0"
+
+
 class TestBaseAgent:
     """Test the BaseAgent abstract class functionality."""
     
@@ -209,3 +392,45 @@ class TestBaseAgent:
                 model_name="test",
                 vram_mb=1000
             )
+
+    def test_load_prompt_template_cached_until_modified(self, tmp_path):
+        """Test that templates are cached per file version and read as UTF-8."""
+        template = tmp_path / "template.md"
+        template.write_text("Résumé: {brief}", encoding="utf-8")
+
+        first = InterpreterAgent.load_prompt_template(str(template))
+        assert first == "Résumé: {brief}"
+        assert PlannerAgent.load_prompt_template(str(template)) is first
+
+        template.write_text("Updated {brief}", encoding="utf-8")
+        stat = template.stat()
+        os.utime(template, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert InterpreterAgent.load_prompt_template(str(template)) == "Updated {brief}"
+
+    def test_exact_cache_reuses_response(self):
+        """Test that an identical prompt is answered from the response cache."""
+        agent = InterpreterAgent(cache_strategy="exact")
+
+        state = SharedState(
+            user_brief="Cached brief",
+            execution_mode=ExecutionMode.RESEARCH
+        )
+
+        def fake_stream(**kwargs):
+            yield '{"intent": {"primary_goal": "Goal"}, "extracted_requirements": []}'
+
+        model_manager = Mock()
+        model_manager.generate_stream.side_effect = fake_stream
+
+        first = agent.think(state, model_manager)
+        second = agent.think(state, model_manager)
+
+        assert second == first
+        assert second is not first
+        assert model_manager.generate_stream.call_count == 1
+
+    def test_invalid_cache_strategy(self):
+        """Test that an unknown cache strategy is rejected."""
+        with pytest.raises(ValueError):
+            InterpreterAgent(cache_strategy="semantic")
@@ -0,0 +1,127 @@
+"""
+Unit tests for PipelineEngine stage grouping and concurrent execution.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock
+
+from src.orchestration.engine import PipelineEngine
+from src.orchestration.state import ExecutionMode
+
+
+def make_agent(model_name="model-a", output=None, side_effect=None):
+    """Create a mock agent with the attributes the engine reads."""
+    agent = Mock()
+    agent.model_name = model_name
+    agent.vram_mb = 4000
+    agent.think.return_value = output if output is not None else {"ok": True}
+    if side_effect is not None:
+        agent.think.side_effect = side_effect
+    return agent
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    """Engine on the repo config, writing its timing report under tmp_path."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("SINGLE_MODEL", raising=False)
+    with PipelineEngine() as engine:
+        yield engine
+
+
+class TestStageGrouping:
+    """Test grouping of pipeline steps into concurrent stages."""
+
+    def test_same_model_independent_agents_share_stage(self, engine):
+        """Auditor and visualizer on one model run as a single stage."""
+        for name in ["planner", "auditor", "visualizer", "judge"]:
+            engine.register_agent(name, make_agent("model-a"))
+
+        stages = engine._group_pipeline_steps(["planner", "auditor", "visualizer", "judge"])
+
+        assert stages == [["planner"], ["auditor", "visualizer"], ["judge"]]
+
+    def test_different_models_stay_sequential(self, engine):
+        """Agents on different models would evict each other, so they are split."""
+        engine.register_agent("auditor", make_agent("model-a"))
+        engine.register_agent("visualizer", make_agent("model-b"))
+
+        stages = engine._group_pipeline_steps(["auditor", "visualizer"])
+
+        assert stages == [["auditor"], ["visualizer"]]
+
+    def test_single_model_mode_groups_different_models(self, engine):
+        """SINGLE_MODEL resolves every agent to one model."""
+        engine.model_manager.single_model = "shared"
+        engine.register_agent("auditor", make_agent("model-a"))
+        engine.register_agent("visualizer", make_agent("model-b"))
+
+        stages = engine._group_pipeline_steps(["auditor", "visualizer"])
+
+        assert stages == [["auditor", "visualizer"]]
+
+
+class TestConcurrentStage:
+    """Test execution of a concurrent stage."""
+
+    def register_project_agents(self, engine, auditor, visualizer):
+        engine.register_agent("interpreter", make_agent(output={"intent": {"domain": "x"}}))
+        engine.register_agent("planner", make_agent(output={"research_questions": []}))
+        engine.register_agent("auditor", auditor)
+        engine.register_agent("visualizer", visualizer)
+        engine.register_agent("judge", make_agent(output={
+            "final_artifact": {"sections": []},
+            "consensus_score": {"overall": 0.9},
+            "decision": "approve"
+        }))
+
+    def test_stage_agents_run_concurrently(self, engine):
+        """Both agents must be inside think() at the same time to pass the barrier."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(output):
+            def think(state, model_manager):
+                barrier.wait()
+                return output
+            return think
+
+        self.register_project_agents(
+            engine,
+            make_agent(side_effect=meet({"risk_assessment": {}})),
+            make_agent(side_effect=meet({"visualizations": []}))
+        )
+
+        state = engine.execute_pipeline("brief", mode=ExecutionMode.PROJECT)
+
+        assert state.errors == []
+        assert state.audit_report == {"risk_assessment": {}}
+        assert state.visualizations == {"visualizations": []}
+
+    def test_error_in_one_agent_keeps_sibling_output(self, engine):
+        """A failing agent is recorded while its stage sibling still applies."""
+        self.register_project_agents(
+            engine,
+            make_agent(side_effect=RuntimeError("auditor down")),
+            make_agent(output={"visualizations": ["chart"]})
+        )
+
+        state = engine.execute_pipeline("brief", mode=ExecutionMode.PROJECT)
+
+        assert [error["agent"] for error in state.errors] == ["auditor"]
+        assert "auditor down" in state.errors[0]["error"]
+        assert state.audit_report is None
+        assert state.visualizations == {"visualizations": ["chart"]}
+        assert state.final_artifact == {"sections": []}
+
+    async def test_runs_inside_event_loop(self, engine):
+        """The synchronous pipeline must not start its own event loop."""
+        self.register_project_agents(
+            engine,
+            make_agent(output={"risk_assessment": {}}),
+            make_agent(output={"visualizations": []})
+        )
+
+        state = engine.execute_pipeline("brief", mode=ExecutionMode.PROJECT)
+
+        assert state.errors == []
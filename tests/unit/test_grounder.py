@@ -0,0 +1,239 @@
+"""
+Unit tests for GrounderAgent evidence retrieval.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+
+from src.agents.grounder import GrounderAgent
+from src.orchestration.state import SharedState, ExecutionMode
+
+
+def web_result(title):
+    """Create a web search result as returned by CachedWebSearch."""
+    return {"title": title, "url": f"https://example.com/{title}", "snippet": title, "content": title}
+
+
+def search_batch(questions, n_results):
+    """Vector results with one document per question."""
+    return [
+        {"documents": [f"doc for {q}"], "metadatas": [{"title": f"doc for {q}"}], "distances": [0.5]}
+        for q in questions
+    ]
+
+
+def vector_store(count):
+    """Mock VectorStore whose collection holds count documents."""
+    store = Mock()
+    store.collection.count.return_value = count
+    store.search_batch.side_effect = search_batch
+    return store
+
+
+@pytest.fixture
+def grounder(tmp_path):
+    """Grounder with mocked retrieval backends and a real citation manager."""
+    with patch('src.agents.grounder.VectorStore') as vector_store, \
+            patch('src.agents.grounder.CachedWebSearch'):
+        vector_store.side_effect = RuntimeError("no vector store")
+        agent = GrounderAgent(evidence_cache_dir=str(tmp_path / "evidence"))
+    return agent
+
+
+class TestRetrieveEvidence:
+    """Test _retrieve_evidence."""
+
+    def test_questions_searched_concurrently(self, grounder):
+        """Both searches must be in flight at once to pass the barrier."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def search(question, max_results):
+            barrier.wait()
+            return [web_result(question)]
+
+        grounder.web_search.search.side_effect = search
+
+        evidence = grounder._retrieve_evidence([
+            {"id": "RQ1", "question": "first"},
+            {"id": "RQ2", "question": "second"}
+        ])
+
+        assert evidence["RQ1"][0]["title"] == "first"
+        assert evidence["RQ2"][0]["title"] == "second"
+
+    def test_citations_follow_question_order(self, grounder):
+        """Citation IDs are assigned in question order, not completion order."""
+        finished_first = threading.Event()
+
+        def search(question, max_results):
+            if question == "slow":
+                finished_first.wait(timeout=5)
+            else:
+                finished_first.set()
+            return [web_result(question)]
+
+        grounder.web_search.search.side_effect = search
+
+        evidence = grounder._retrieve_evidence([
+            {"id": "RQ1", "question": "slow"},
+            {"id": "RQ2", "question": "fast"}
+        ])
+
+        assert evidence["RQ1"][0]["citation_id"] == "cite1"
+        assert evidence["RQ2"][0]["citation_id"] == "cite2"
+
+    def test_failed_search_keeps_other_questions(self, grounder):
+        """A failing web search leaves that question without evidence only."""
+        def search(question, max_results):
+            if question == "broken":
+                raise RuntimeError("rate limited")
+            return [web_result(question)]
+
+        grounder.web_search.search.side_effect = search
+
+        evidence = grounder._retrieve_evidence([
+            {"id": "RQ1", "question": "broken"},
+            {"id": "RQ2", "question": "works"}
+        ])
+
+        assert evidence["RQ1"] == []
+        assert evidence["RQ2"][0]["title"] == "works"
+
+    def test_no_questions(self, grounder):
+        """An empty question list retrieves nothing."""
+        assert grounder._retrieve_evidence([]) == {}
+
+    def test_vector_store_queried_once(self, grounder):
+        """All questions go to the vector store in one batched query."""
+        grounder.web_search.search.return_value = []
+        grounder.vector_store = Mock()
+        grounder.vector_store.search_batch.return_value = [
+            {"documents": ["doc one"], "metadatas": [{"title": "One"}], "distances": [0.25]},
+            {"documents": [], "metadatas": [], "distances": []}
+        ]
+
+        evidence = grounder._retrieve_evidence([
+            {"id": "RQ1", "question": "first"},
+            {"id": "RQ2", "question": "second"}
+        ])
+
+        grounder.vector_store.search_batch.assert_called_once_with(["first", "second"], n_results=5)
+        assert evidence["RQ1"][0]["title"] == "One"
+        assert evidence["RQ1"][0]["relevance_score"] == 0.75
+        assert evidence["RQ2"] == []
+
+    def test_cached_vector_results_reused(self, grounder):
+        """A repeated question reuses its vector results; the web is still searched."""
+        grounder.web_search.search.side_effect = lambda question, max_results: [web_result(question)]
+        grounder.vector_store = vector_store(count=3)
+
+        grounder._retrieve_evidence([{"id": "RQ1", "question": "first"}])
+        evidence = grounder._retrieve_evidence([
+            {"id": "RQ1", "question": "first"},
+            {"id": "RQ2", "question": "second"}
+        ])
+
+        queried = [call.args[0] for call in grounder.vector_store.search_batch.call_args_list]
+        assert queried == [["first"], ["second"]]
+        assert grounder.web_search.search.call_count == 3
+        assert evidence["RQ1"][1]["title"] == "doc for first"
+
+    def test_ingestion_invalidates_cache(self, grounder):
+        """New documents in the collection force a fresh vector query."""
+        grounder.web_search.search.return_value = []
+        grounder.vector_store = vector_store(count=3)
+
+        grounder._retrieve_evidence([{"id": "RQ1", "question": "first"}])
+        grounder.vector_store.collection.count.return_value = 4
+        grounder._retrieve_evidence([{"id": "RQ1", "question": "first"}])
+
+        assert grounder.vector_store.search_batch.call_count == 2
+
+    def test_vector_store_down_then_up(self, grounder):
+        """A failed vector query is not cached, so a recovered store is queried."""
+        grounder.web_search.search.side_effect = lambda question, max_results: [web_result(question)]
+        grounder.vector_store = vector_store(count=3)
+        grounder.vector_store.search_batch.side_effect = RuntimeError("chroma down")
+
+        evidence = grounder._retrieve_evidence([{"id": "RQ1", "question": "first"}])
+        assert [source["source"] for source in evidence["RQ1"]] == ["web"]
+
+        grounder.vector_store.search_batch.side_effect = search_batch
+        evidence = grounder._retrieve_evidence([{"id": "RQ1", "question": "first"}])
+
+        assert [source["source"] for source in evidence["RQ1"]] == ["web", "vector_db"]
+
+    def test_cache_pruned_to_limit(self, grounder, monkeypatch):
+        """The oldest cache files are deleted beyond the size limit."""
+        monkeypatch.setattr('src.agents.grounder._EVIDENCE_CACHE_MAX_FILES', 2)
+        grounder.web_search.search.return_value = []
+        grounder.vector_store = vector_store(count=3)
+
+        for question in ("one", "two", "three"):
+            grounder._retrieve_evidence([{"id": "RQ1", "question": question}])
+
+        assert len(list(grounder.evidence_cache_dir.glob("*.pkl"))) == 2
+
+    def test_duplicate_questions_searched_once(self, grounder):
+        """Research questions with identical text share one search."""
+        grounder.web_search.search.side_effect = lambda question, max_results: [web_result(question)]
+
+        evidence = grounder._retrieve_evidence([
+            {"id": "RQ1", "question": "same"},
+            {"id": "RQ2", "question": "same"}
+        ])
+
+        assert grounder.web_search.search.call_count == 1
+        assert evidence["RQ1"][0]["title"] == evidence["RQ2"][0]["title"] == "same"
+
+    def test_evidence_ranked_and_limited(self, grounder):
+        """Only the max_sources most relevant sources are kept, best first."""
+        grounder.max_sources = 2
+        grounder.web_search.search.return_value = [web_result("web")]
+        grounder.vector_store = Mock()
+        grounder.vector_store.search_batch.return_value = [{
+            "documents": ["far", "near"],
+            "metadatas": [{"title": "far"}, {"title": "near"}],
+            "distances": [0.9, 0.1]
+        }]
+
+        evidence = grounder._retrieve_evidence([{"id": "RQ1", "question": "first"}])
+
+        assert [source["title"] for source in evidence["RQ1"]] == ["web", "near"]
+
+    def test_source_text_truncated_once(self, grounder):
+        """Sources keep 1000 characters of content and a 500-character preview."""
+        long_result = dict(web_result("long"), content="x" * 5000)
+        grounder.web_search.search.return_value = [long_result]
+
+        source = grounder._retrieve_evidence([{"id": "RQ1", "question": "first"}])["RQ1"][0]
+
+        assert len(source["content"]) == 1000
+        assert source["preview"] == "x" * 500
+
+
+class TestPreparePrompt:
+    """Test _prepare_prompt."""
+
+    def test_prompt_without_evidence(self, grounder):
+        """With no sources the prompt drops the citation requirements."""
+        grounder.web_search.search.return_value = []
+        state = SharedState(user_brief="Test brief", execution_mode=ExecutionMode.RESEARCH)
+
+        prompt = grounder._prepare_prompt(state)
+
+        assert "No sources could be retrieved" in prompt
+        assert "CITATION REQUIREMENTS" not in prompt
+        assert "## Retrieved Evidence" not in prompt
+
+    def test_prompt_with_evidence(self, grounder):
+        """Retrieved sources are listed after the citation instructions."""
+        grounder.web_search.search.return_value = [web_result("found")]
+        state = SharedState(user_brief="Test brief", execution_mode=ExecutionMode.RESEARCH)
+
+        prompt = grounder._prepare_prompt(state)
+
+        assert "CITATION REQUIREMENTS" in prompt
+        assert "[Source 1] **found**" in prompt
+        assert prompt.index("CITATION REQUIREMENTS") < prompt.index("## Retrieved Evidence")
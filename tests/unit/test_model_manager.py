@@ -96,7 +96,23 @@ class TestModelManager:
         assert success == True
         assert manager.is_model_loaded("test_model")
         assert manager.get_current_model() == "test_model"
-    
+
+    @patch('src.orchestration.model_manager.httpx.Client')
+    def test_model_loading_quiet(self, mock_client, capsys):
+        """Test that announce=False keeps load progress off stdout."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+
+        mock_http_instance = Mock()
+        mock_http_instance.post.return_value = mock_response
+        mock_client.return_value = mock_http_instance
+
+        manager = ModelManager()
+
+        assert manager.load_model("test_model", 5000, "test_agent", announce=False)
+        assert manager.get_current_model() == "test_model"
+        assert capsys.readouterr().out == ""
+
     @patch('src.orchestration.model_manager.httpx.Client')
     def test_model_swap(self, mock_client):
         """Test swapping between models."""
@@ -0,0 +1,103 @@
+"""
+Unit tests for the single-model mode model selector.
+"""
+
+import json
+import pytest
+from unittest.mock import MagicMock, patch
+
+from src.cli import model_selector
+from src.cli.model_selector import get_available_models, display_model_menu, select_model_interactive
+
+GB = 1024 ** 3
+
+
+def tags_response(models):
+    """Create an urlopen() context manager returning an /api/tags body."""
+    response = MagicMock()
+    response.__enter__.return_value.read.return_value = json.dumps({"models": models}).encode()
+    return response
+
+
+@pytest.fixture(autouse=True)
+def clear_models_cache():
+    """Each test starts without cached model lists."""
+    model_selector._models_cache.clear()
+    yield
+    model_selector._models_cache.clear()
+
+
+class TestGetAvailableModels:
+    """Test get_available_models caching."""
+
+    @patch('src.cli.model_selector.urllib.request.urlopen')
+    def test_cached_within_ttl(self, mock_urlopen):
+        """A second call within the TTL does not query Ollama."""
+        mock_urlopen.return_value = tags_response([{"name": "qwen2.5:7b"}])
+
+        first = get_available_models("http://ollama:11434")
+        second = get_available_models("http://ollama:11434")
+
+        assert second == first == [{"name": "qwen2.5:7b"}]
+        assert mock_urlopen.call_count == 1
+
+    @patch('src.cli.model_selector.urllib.request.urlopen')
+    def test_force_refresh(self, mock_urlopen):
+        """force_refresh always queries Ollama."""
+        mock_urlopen.return_value = tags_response([{"name": "qwen2.5:7b"}])
+
+        get_available_models("http://ollama:11434")
+        get_available_models("http://ollama:11434", force_refresh=True)
+
+        assert mock_urlopen.call_count == 2
+
+    @patch('src.cli.model_selector.time.monotonic')
+    @patch('src.cli.model_selector.urllib.request.urlopen')
+    def test_expired_entry_refetched(self, mock_urlopen, mock_monotonic):
+        """An entry older than the TTL is fetched again."""
+        mock_urlopen.return_value = tags_response([{"name": "qwen2.5:7b"}])
+        mock_monotonic.return_value = 100.0
+        get_available_models("http://ollama:11434")
+
+        mock_monotonic.return_value = 100.0 + model_selector._MODELS_CACHE_TTL
+        get_available_models("http://ollama:11434")
+
+        assert mock_urlopen.call_count == 2
+
+    @patch('src.cli.model_selector.urllib.request.urlopen')
+    def test_empty_list_not_cached(self, mock_urlopen):
+        """An empty model list is fetched again on the next call."""
+        mock_urlopen.return_value = tags_response([])
+
+        assert get_available_models("http://ollama:11434") == []
+        get_available_models("http://ollama:11434")
+
+        assert mock_urlopen.call_count == 2
+
+
+class TestModelMenu:
+    """Test the model menu and selection."""
+
+    @pytest.mark.parametrize("size_gb, label", [
+        (2.9, "Fast, Basic"),
+        (3.0, "Balanced"),
+        (5.9, "Balanced"),
+        (6.0, "High Quality"),
+        (8.0, "Best Quality"),
+    ])
+    def test_quality_tier(self, capsys, size_gb, label):
+        """Tiers switch at 3, 6 and 8 GB."""
+        display_model_menu([{"name": "m", "size": int(size_gb * GB)}])
+
+        assert f"({label})" in capsys.readouterr().out
+
+    @patch('builtins.input', side_effect=["1", "y"])
+    @patch('src.cli.model_selector.get_available_models')
+    def test_selection_matches_menu_order(self, mock_models, mock_input, capsys):
+        """Number 1 is the smallest model, as displayed, not the first returned."""
+        mock_models.return_value = [
+            {"name": "big:14b", "size": 9 * GB},
+            {"name": "small:3b", "size": 2 * GB},
+        ]
+
+        assert select_model_interactive("http://ollama:11434") == "small:3b"
@@ -0,0 +1,53 @@
+"""
+Unit tests for VectorStore query batching.
+"""
+
+from unittest.mock import Mock
+
+from src.tools.vector_store import VectorStore
+
+
+def make_store():
+    """VectorStore with a mocked encoder and collection, skipping ChromaDB setup."""
+    store = VectorStore.__new__(VectorStore)
+    store.encoder = Mock()
+    store.encoder.encode.side_effect = lambda texts: Mock(tolist=lambda: [[0.0] * 3 for _ in texts])
+    store.collection = Mock()
+    return store
+
+
+class TestSearchBatch:
+    """Test VectorStore.search_batch."""
+
+    def test_one_query_for_all_texts(self):
+        """Queries are embedded and sent to ChromaDB in a single call."""
+        store = make_store()
+        store.collection.query.return_value = {
+            'ids': [['a'], ['b']],
+            'documents': [['doc a'], ['doc b']],
+            'metadatas': [[{}], [{}]],
+            'distances': [[0.1], [0.2]]
+        }
+
+        results = store.search_batch(["first", "second"], n_results=1)
+
+        store.encoder.encode.assert_called_once_with(["first", "second"])
+        store.collection.query.assert_called_once()
+        assert [r['documents'] for r in results] == [['doc a'], ['doc b']]
+        assert results[1]['distances'] == [0.2]
+
+    def test_search_unwraps_single_query(self):
+        """search() returns the flat result for its one query."""
+        store = make_store()
+        store.collection.query.return_value = {
+            'ids': [['a']], 'documents': [['doc a']], 'metadatas': [[{}]], 'distances': [[0.1]]
+        }
+
+        assert store.search("first", n_results=1)['ids'] == ['a']
+
+    def test_empty_batch(self):
+        """No queries means no ChromaDB call."""
+        store = make_store()
+
+        assert store.search_batch([]) == []
+        store.collection.query.assert_not_called()
@@ -0,0 +1,27 @@
+"""
+Unit tests for single-model VRAM estimation from model tags.
+"""
+
+import pytest
+
+from src.__main__ import _estimate_vram_mb
+
+
+class TestEstimateVramMb:
+    """Test _estimate_vram_mb thresholds."""
+
+    @pytest.mark.parametrize("model_name, expected_mb", [
+        ("phi3.5:3.8b-mini-instruct-q4_K_M", 3000),
+        ("qwen2.5:7b-instruct-q4_K_M", 4500),
+        ("llama3.1:8b-instruct-q4_K_M", 5500),
+        ("gemma2:9b", 5500),
+        ("mistral-nemo:12b-instruct-q4_K_M", 9000),
+        ("llama2:13b", 9000),
+        ("qwen2.5:14b", 9000),
+        ("qwen2.5:32b", 12000),
+        ("mixtral:8x7b", 12000),
+        ("llama3.2:latest", 3000),
+    ])
+    def test_estimate(self, model_name, expected_mb):
+        """Test the estimate for common Ollama tags."""
+        assert _estimate_vram_mb(model_name) == expected_mb